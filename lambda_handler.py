@@ -10,8 +10,8 @@ import os
 import json
 import logging
 import sys
+import time
 import pytz
-import boto3
 from datetime import datetime
 from typing import Dict, Any
 
@@ -20,10 +20,11 @@ from aws_lambda_powertools.utilities.typing import LambdaContext
 
 from src.config import get_config
 from src.archer.auth import get_archer_auth
-from src.processing.preprocess import preprocess
+from src.processing.preprocess import preprocess, iter_records
 from src.ops_portal.api import send
 from src.utils.time_utils import get_last_run_time_from_ssm, update_last_run_time_in_ssm, get_current_time
 from src.utils.secrets_manager import load_config_from_secrets
+from src.utils.ssm_client import get_ssm_client
 from src.utils.logging_utils import get_logging_level_from_env, get_logging_level_from_config
 
 # Set up logging with Eastern timezone
@@ -155,22 +156,30 @@ def load_config_from_env() -> Dict[str, Any]:
     return config
 
 
+# Seconds a last incident ID read from SSM is reused before fetching it again
+SSM_CACHE_TTL = 60
+
+# Last incident ID read from or written to SSM, kept across warm invocations:
+# {'value': int, 'expires_at': float}
+_ssm_cache: Dict[str, Any] = {}
+
+
 def get_last_incident_id_from_ssm() -> int:
     """
     Get the last processed incident ID from AWS Systems Manager Parameter Store.
     
+    The value is cached for SSM_CACHE_TTL seconds, so warm invocations within that
+    time don't read the Parameter Store again.
+    
     Returns:
         int: Last processed incident ID, or 0 if none found
     """
+    if time.monotonic() < _ssm_cache.get('expires_at', 0):
+        return _ssm_cache['value']
+    
     try:
         # Get endpoint URL from environment variable if running locally
-        endpoint_url = os.environ.get('AWS_ENDPOINT_URL')
-        
-        # Create SSM client with endpoint URL if provided
-        if endpoint_url:
-            ssm = boto3.client('ssm', endpoint_url=endpoint_url)
-        else:
-            ssm = boto3.client('ssm')
+        ssm = get_ssm_client(os.environ.get('AWS_ENDPOINT_URL'))
             
         parameter_name = '/ops-api/last-incident-id'
         
@@ -182,12 +191,14 @@ def get_last_incident_id_from_ssm() -> int:
             incident_id = int(incident_id_str.strip())
             
             logger.info(f"Retrieved last incident ID from SSM: {incident_id}")
-            return incident_id
             
         except ssm.exceptions.ParameterNotFound:
             # Parameter doesn't exist yet, this is normal for first run
             logger.info("No previous incident ID found in SSM. Starting from 0")
-            return 0
+            incident_id = 0
+        
+        _ssm_cache.update(value=incident_id, expires_at=time.monotonic() + SSM_CACHE_TTL)
+        return incident_id
             
     except Exception as e:
         logger.warning(f"Error getting last incident ID from SSM: {str(e)}. Starting from 0.")
@@ -203,13 +214,7 @@ def update_last_incident_id_in_ssm(incident_id: int) -> None:
     """
     try:
         # Get endpoint URL from environment variable if running locally
-        endpoint_url = os.environ.get('AWS_ENDPOINT_URL')
-        
-        # Create SSM client with endpoint URL if provided
-        if endpoint_url:
-            ssm = boto3.client('ssm', endpoint_url=endpoint_url)
-        else:
-            ssm = boto3.client('ssm')
+        ssm = get_ssm_client(os.environ.get('AWS_ENDPOINT_URL'))
             
         parameter_name = '/ops-api/last-incident-id'
         
@@ -221,6 +226,9 @@ def update_last_incident_id_in_ssm(incident_id: int) -> None:
             Description='Last processed incident ID for OPS API Lambda function'
         )
         
+        # Write through so the next read doesn't need to go back to SSM
+        _ssm_cache.update(value=incident_id, expires_at=time.monotonic() + SSM_CACHE_TTL)
+        
         logger.info(f"Updated last incident ID in SSM: {incident_id}")
         
     except Exception as e:
@@ -295,26 +303,27 @@ def lambda_handler(event: Dict[str, Any], context: LambdaContext) -> Dict[str, A
         }
         
         if not processed_data.empty:
-            records = processed_data.to_dict('records')
+            record_count = len(processed_data)
             
             # Check if this is a dry run
             dry_run = event.get('dry_run', False)
             
             if dry_run:
-                logger.info(f"Dry run: Would send {len(records)} records to OPS Portal")
+                logger.info(f"Dry run: Would send {record_count} records to OPS Portal")
                 results['sent'] = 0
             else:
-                logger.info(f"Sending {len(records)} records to OPS Portal")
+                logger.info(f"Sending {record_count} records to OPS Portal")
                 ops_portal_config = config['ops_portal']
-                responses = send(records, ops_portal_config)
+                # Records are produced row by row as they are sent, rather than as a list
+                responses = send(iter_records(processed_data), ops_portal_config)
                 
                 # Log results
                 success_count = sum(1 for status, _ in responses.values() if 200 <= status < 300)
-                results['sent'] = len(records)
+                results['sent'] = record_count
                 results['success'] = success_count
-                results['failed'] = len(records) - success_count
+                results['failed'] = record_count - success_count
                 
-                logger.info(f"Successfully sent {success_count} of {len(records)} records")
+                logger.info(f"Successfully sent {success_count} of {record_count} records")
                 
                 # Log failures
                 for id, (status, response) in responses.items():
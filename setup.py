@@ -13,6 +13,7 @@ setup(
         "numpy>=1.18.0",
         "requests>=2.22.0",
         "pytz>=2019.3",
+        "tzdata>=2023.3",
         "uscis-opts>=0.1.4",
         "python-dotenv>=0.19.0",
         "boto3>=1.18.0",
@@ -27,5 +28,5 @@ setup(
     author_email="info@cvpcorp.com",
     description="OPS API for syncing SIR data from Archer to DHS OPS Portal",
     keywords="ops, api, archer, dhs",
-    python_requires=">=3.6",
+    python_requires=">=3.9",
 )
@@ -8,16 +8,43 @@ This module uses the ArcherAuth class from the uscis-opts package, which can be
 installed via pip: `pip install uscis-opts>=0.1.4`.
 """
 
-from typing import Dict, List, Any, Optional
+import re
+import threading
+import time
+from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime
+
+import pytz
+import urllib3
+
 from ..utils.logging_utils import get_logger
 
 # Get logger for this module
 logger = get_logger('archer.auth')
 
+# Whether InsecureRequestWarning has already been disabled for this process
+_SSL_WARNINGS_SUPPRESSED = False
+
+# Cached get_sir_data results keyed on (base_url, instance, since_incident_id, since_date),
+# mapping to (expires_at, records). Lives for the lifetime of the process (warm Lambda container),
+# kept in least-recently-used order with expired entries pruned on each write.
+_sir_data_cache: Dict[Tuple, Tuple[float, List[Dict[str, Any]]]] = {}
+# Guards every read and update of _sir_data_cache, which is shared between threads
+_sir_data_cache_lock = threading.Lock()
+
+# Most cached get_sir_data results kept per (base_url, instance)
+_SIR_CACHE_MAX_ENTRIES = 8
+
+# Endpoint name extractors keyed by the endpoint's exact type
+_ENDPOINT_NAME_EXTRACTORS = {
+    dict: lambda endpoint: endpoint.get('name', ''),
+    str: lambda endpoint: endpoint,
+}
+
 # Import the ArcherAuth class from the archer package
 try:
     from opts.ArcherAuth import ArcherAuth as BaseArcherAuth
+    from opts.ArcherServerClient import ArcherServerClient
     logger.info("Successfully imported ArcherAuth from archer package")
     
     # Extend the ArcherAuth class to add the get_sir_data method
@@ -29,7 +56,8 @@ try:
         to add functionality specific to retrieving SIR data.
         """
         
-        def __init__(self, ins: str, usr: str, pwd: str, url: str, dom: str = '', verify_ssl: bool = False):
+        def __init__(self, ins: str, usr: str, pwd: str, url: str, dom: str = '', verify_ssl: bool = False,
+                     cache_ttl: float = 0):
             """
             Initialize the ArcherAuth instance with SSL verification control.
             
@@ -40,16 +68,20 @@ try:
                 url (str): Archer URL endpoint
                 dom (str, optional): User domain (usually blank)
                 verify_ssl (bool, optional): Whether to verify SSL certificates (default: True)
+                cache_ttl (float, optional): Seconds to cache get_sir_data results (default: 0, disabled)
             """
             super().__init__(ins, usr, pwd, url, dom)
+            self.cache_ttl = cache_ttl
             
             # Configure SSL verification
             if not verify_ssl:
                 logger.warning("SSL verification disabled for Archer authentication")
                 self.session.verify = False
-                # Suppress SSL warnings when verification is disabled
-                import urllib3
-                urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+                # Suppress SSL warnings when verification is disabled (once per process)
+                global _SSL_WARNINGS_SUPPRESSED
+                if not _SSL_WARNINGS_SUPPRESSED:
+                    urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+                    _SSL_WARNINGS_SUPPRESSED = True
             else:
                 self.session.verify = False
                 logger.info("SSL verification enabled for Archer authentication")
@@ -67,6 +99,19 @@ try:
             Returns:
                 List[Dict[str, Any]]: List of SIR data records
             """
+            cache_key = (self.base_url, self.ins, since_incident_id, since_date)
+            if self.cache_ttl > 0:
+                with _sir_data_cache_lock:
+                    cached = _sir_data_cache.get(cache_key)
+                    if cached is not None and time.monotonic() < cached[0]:
+                        # Move the hit to the end so it is evicted last
+                        _sir_data_cache[cache_key] = _sir_data_cache.pop(cache_key)
+                    else:
+                        cached = None
+                if cached is not None:
+                    logger.info(f"Using {len(cached[1])} cached SIR records for instance: {self.ins}")
+                    return list(cached[1])
+            
             try:
                 self._ensure_authenticated()
                 client = self._create_archer_client()
@@ -88,12 +133,55 @@ try:
                 sir_records = self._filter_records_by_status(sir_records)
                 
                 logger.info(f"Retrieved {len(sir_records)} SIR records from Archer")
+                
+                if self.cache_ttl > 0:
+                    self._cache_sir_data(cache_key, sir_records)
+                
                 return sir_records
                 
             except Exception as e:
                 logger.exception(f"Error retrieving SIR data from Archer: {str(e)}")
                 return []
         
+        def logout(self) -> None:
+            """
+            Logout of the Archer instance and drop its cached SIR data.
+            """
+            self.invalidate_cache()
+            super().logout()
+        
+        def invalidate_cache(self) -> None:
+            """Remove all cached get_sir_data results for this Archer instance."""
+            instance_key = (self.base_url, self.ins)
+            with _sir_data_cache_lock:
+                for key in list(_sir_data_cache):
+                    if key[:2] == instance_key:
+                        del _sir_data_cache[key]
+        
+        def _cache_sir_data(self, cache_key: Tuple, records: List[Dict[str, Any]]) -> None:
+            """
+            Cache get_sir_data results, pruning expired entries and evicting this
+            instance's least recently used entries beyond _SIR_CACHE_MAX_ENTRIES.
+            
+            Args:
+                cache_key: Key of the results being cached
+                records: SIR records to cache
+            """
+            entry = (time.monotonic() + self.cache_ttl, list(records))
+            with _sir_data_cache_lock:
+                now = time.monotonic()
+                for key, (expires_at, _) in list(_sir_data_cache.items()):
+                    if expires_at <= now:
+                        del _sir_data_cache[key]
+                
+                _sir_data_cache.pop(cache_key, None)
+                instance_key = cache_key[:2]
+                instance_keys = [key for key in _sir_data_cache if key[:2] == instance_key]
+                for key in instance_keys[:max(0, len(instance_keys) - _SIR_CACHE_MAX_ENTRIES + 1)]:
+                    del _sir_data_cache[key]
+                
+                _sir_data_cache[cache_key] = entry
+        
         def _ensure_authenticated(self) -> None:
             """Ensure the client is authenticated before making requests."""
             if not self.authenticated:
@@ -101,7 +189,6 @@ try:
         
         def _create_archer_client(self):
             """Create and return an ArcherServerClient instance."""
-            from opts.ArcherServerClient import ArcherServerClient
             return ArcherServerClient(self)
         
         def _find_sir_level_alias(self, client) -> Optional[str]:
@@ -141,14 +228,14 @@ try:
                 List[str]: List of endpoint names
             """
             endpoint_names = []
+            append = endpoint_names.append
             for endpoint in endpoints:
-                if isinstance(endpoint, dict):
-                    endpoint_names.append(endpoint.get('name', ''))
-                elif isinstance(endpoint, str):
-                    endpoint_names.append(endpoint)
+                extractor = _ENDPOINT_NAME_EXTRACTORS.get(type(endpoint))
+                if extractor is not None:
+                    append(extractor(endpoint))
                 else:
                     logger.warning(f"Unexpected endpoint format: {type(endpoint)} - {endpoint}")
-                    endpoint_names.append(str(endpoint))
+                    append(str(endpoint))
             return endpoint_names
         
         def _find_alternative_incident_alias(self, endpoints: List, endpoint_names: List[str]) -> Optional[str]:
@@ -225,13 +312,13 @@ try:
             if since_date is None or not records:
                 return records
             
-            from datetime import datetime
-            import pytz
-            
             # Ensure since_date is timezone-aware
             if since_date.tzinfo is None:
                 since_date = pytz.UTC.localize(since_date)
             
+            # Compare POSIX timestamps rather than timezone-aware datetimes per record
+            since_ts = since_date.timestamp()
+            
             filtered_records = []
             for record in records:
                 # Try Date_Time_SIR_Processed first, then fall back to Date_SIR_Processed__NT
@@ -247,7 +334,7 @@ try:
                 
                 # If we have a valid date and it's after since_date, include the record
                 if record_date is not None:
-                    if record_date > since_date:
+                    if record_date.timestamp() > since_ts:
                         filtered_records.append(record)
                 else:
                     logger.warning("No valid date field found for record, including it anyway")
@@ -266,10 +353,6 @@ try:
             Returns:
                 datetime: Parsed datetime object or None if parsing fails
             """
-            from datetime import datetime
-            import pytz
-            import re
-            
             if not date_str:
                 return None
                 
@@ -365,8 +448,6 @@ try:
                 return None
             
             try:
-                from datetime import datetime
-                import re
                 if isinstance(date_created, str):
                     # Handle timezone formats like -04:00, +00:00, or Z
                     date_str = date_created
@@ -404,11 +485,9 @@ try:
                 return records
             
             target_status = "Assigned for Further Action"
-            filtered_records = []
             
-            for record in records:
-                if self._has_target_submission_status(record, target_status):
-                    filtered_records.append(record)
+            has_target_status = self._has_target_submission_status
+            filtered_records = [record for record in records if has_target_status(record, target_status)]
             
             logger.info(f"Filtered SIR data to {len(filtered_records)} records with Submission_Status_1 = '{target_status}'")
             return filtered_records
@@ -426,12 +505,9 @@ try:
             """
             submission_status = record.get('Submission_Status_1', '')
             
-            if isinstance(submission_status, list):
-                return target_status in submission_status
-            elif isinstance(submission_status, str):
+            if isinstance(submission_status, str):
                 return submission_status == target_status
-            
-            return False
+            return isinstance(submission_status, list) and target_status in submission_status
             
 except ImportError:
     logger.error(
@@ -448,7 +524,8 @@ except ImportError:
         but does not actually connect to the Archer system.
         """
         
-        def __init__(self, ins: str, usr: str, pwd: str, url: str, dom: str = '', verify_ssl: bool = True):
+        def __init__(self, ins: str, usr: str, pwd: str, url: str, dom: str = '', verify_ssl: bool = True,
+                     cache_ttl: float = 0):
             """
             Initialize the Archer authentication client.
             
@@ -459,6 +536,7 @@ except ImportError:
                 url (str): Archer URL endpoint
                 dom (str, optional): User domain (usually blank)
                 verify_ssl (bool, optional): Whether to verify SSL certificates (default: True)
+                cache_ttl (float, optional): Seconds to cache get_sir_data results (ignored by the fallback)
             """
             self.ins = ins
             self.usr = usr
@@ -466,6 +544,7 @@ except ImportError:
             self.base_url = url
             self.dom = dom
             self.verify_ssl = verify_ssl
+            self.cache_ttl = cache_ttl
             self.authenticated = False
             logger.info(f"Initialized fallback ArcherAuth for instance: {ins}, url: {url}, verify_ssl: {verify_ssl}")
         
@@ -522,6 +601,7 @@ def get_archer_auth(config: Dict[str, Any]) -> ArcherAuth:
             Optional keys:
             - domain: User domain (usually blank)
             - verify_ssl: Whether to verify SSL certificates (default: True)
+            - cache_ttl: Seconds to cache get_sir_data results (default: 0, disabled)
             
     Returns:
         ArcherAuth: Initialized ArcherAuth instance
@@ -540,9 +620,11 @@ def get_archer_auth(config: Dict[str, Any]) -> ArcherAuth:
         verify_ssl_str = str(verify_ssl_value).lower()
         verify_ssl = verify_ssl_str in ('true', '1', 'yes', 'on')
     
+    cache_ttl = float(config.get('cache_ttl', 0) or 0)
+    
     try:
         # Note: Parameter order matches the original ArcherAuth class (ins, usr, pwd, url, dom)
-        auth = ArcherAuth(instance, username, password, url, domain, verify_ssl=verify_ssl)
+        auth = ArcherAuth(instance, username, password, url, domain, verify_ssl=verify_ssl, cache_ttl=cache_ttl)
         logger.info(f"Created ArcherAuth instance for instance: {instance}, url: {url}, verify_ssl: {verify_ssl}")
         return auth
     except Exception as e:
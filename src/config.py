@@ -23,6 +23,9 @@ from .utils.logging_utils import get_logger
 # Get logger for this module
 logger = get_logger('config')
 
+# Environment variable sections that are mirrored into another section
+_SECTION_ALIASES = {'opsportal': 'ops_portal'}
+
 
 class Config:
     """
@@ -51,6 +54,8 @@ class Config:
             config_file = project_root / 'config' / 'config.ini'
         
         self.config_file = config_file
+        # Resolve the path once so reloads don't repeat the lookup
+        self._config_path = Path(config_file).resolve()
         
         logger.info(f"Initializing configuration from {self.config_file} and environment variables")
         
@@ -85,14 +90,16 @@ class Config:
         Load configuration from the config file.
         """
         try:
-            if not os.path.exists(self.config_file):
+            try:
+                config_text = self._config_path.read_text()
+            except FileNotFoundError:
                 logger.warning(f"Config file not found: {self.config_file}")
                 return
             
             logger.info(f"Loading configuration from file: {self.config_file}")
             
             parser = configparser.ConfigParser()
-            parser.read(self.config_file)
+            parser.read_string(config_text, source=str(self._config_path))
             
             # Convert to dictionary
             for section in parser.sections():
@@ -132,34 +139,34 @@ class Config:
         For example, OPSAPI_ARCHER_USERNAME would override config['archer']['username'].
         """
         prefix = 'OPSAPI_'
+        prefix_len = len(prefix)
         
-        for env_var, value in os.environ.items():
-            if env_var.startswith(prefix):
-                # Remove prefix and split by underscore
-                parts = env_var[len(prefix):].lower().split('_', 1)
-                
-                if len(parts) == 2:
-                    section, key = parts
-                    
-                    # Handle multi-part keys (e.g., OPSAPI_OPS_PORTAL_CERT_PEM)
-                    if section == 'ops' and key.startswith('portal_'):
-                        section = 'ops_portal'
-                        key = key[7:]  # Remove 'portal_' prefix
-                    
-                    # Create section if it doesn't exist
-                    if section not in self.config:
-                        self.config[section] = {}
-                    
-                    # Set value
-                    self.config[section][key] = value
-                    logger.debug(f"Setting config[{section}][{key}] from environment variable")
-                    
-                    # Also map opsportal section to ops_portal for backward compatibility
-                    if section == 'opsportal':
-                        if 'ops_portal' not in self.config:
-                            self.config['ops_portal'] = {}
-                        self.config['ops_portal'][key] = value
-                        logger.debug(f"Also setting config[ops_portal][{key}] from environment variable")
+        # Collect the prefixed variables in a single pass over the environment
+        env_items = [
+            (env_var[prefix_len:].lower(), value)
+            for env_var, value in os.environ.items()
+            if env_var.startswith(prefix)
+        ]
+        
+        for name, value in env_items:
+            section, separator, key = name.partition('_')
+            if not separator:
+                continue
+            
+            # Handle multi-part keys (e.g., OPSAPI_OPS_PORTAL_CERT_PEM)
+            if section == 'ops' and key.startswith('portal_'):
+                section = 'ops_portal'
+                key = key[7:]  # Remove 'portal_' prefix
+            
+            # Set value, creating the section if it doesn't exist
+            self.config.setdefault(section, {})[key] = value
+            logger.debug(f"Setting config[{section}][{key}] from environment variable")
+            
+            # Also map aliased sections (e.g. opsportal -> ops_portal) for backward compatibility
+            alias = _SECTION_ALIASES.get(section)
+            if alias:
+                self.config.setdefault(alias, {})[key] = value
+                logger.debug(f"Also setting config[{alias}][{key}] from environment variable")
     
     def get(self, section: str, key: str, default: Any = None) -> Any:
         """
@@ -173,10 +180,10 @@ class Config:
         Returns:
             Any: Configuration value or default
         """
-        try:
-            return self.config.get(section, {}).get(key, default)
-        except Exception:
+        section_dict = self.config.get(section)
+        if section_dict is None:
             return default
+        return section_dict.get(key, default)
     
     def get_section(self, section: str) -> Dict[str, Any]:
         """
@@ -212,8 +219,8 @@ class Config:
         ]
 
 
-# Create a default configuration instance
-default_config = Config()
+# Default configuration instance, created on first use by get_config()
+_default_config: Optional[Config] = None
 
 
 def get_config(config_file: Optional[str] = None) -> Config:
@@ -227,7 +234,26 @@ def get_config(config_file: Optional[str] = None) -> Config:
     Returns:
         Config: Configuration instance
     """
+    global _default_config
+    
     if config_file is None:
-        return default_config
+        if _default_config is None:
+            _default_config = Config()
+        return _default_config
     else:
         return Config(config_file)
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Resolve the lazily created default_config module attribute.
+    
+    Args:
+        name (str): Attribute name
+        
+    Returns:
+        Any: The default configuration instance for 'default_config'
+    """
+    if name == 'default_config':
+        return get_config()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
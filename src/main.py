@@ -10,17 +10,45 @@ import os
 import sys
 import argparse
 import logging
-import boto3
 from datetime import datetime
 from typing import Dict, List, Any, Optional
 
 from .config import get_config
 from .archer.auth import get_archer_auth
-from .processing.preprocess import preprocess
+from .processing.preprocess import preprocess, iter_records
 from .ops_portal.api import send
 from .utils.time_utils import log_time, get_last_run_time_from_ssm, update_last_run_time_in_ssm, get_current_time
 from .utils.logging_utils import setup_logging, get_logger
 from .utils.secrets_manager import load_config_from_secrets
+from .utils.ssm_client import get_ssm_client
+
+
+class SecretsConfig:
+    """
+    Configuration loaded from AWS Secrets Manager, exposing the same
+    get_section interface as the Config class.
+    """
+    
+    def __init__(self, config_data: Dict[str, Any]):
+        """
+        Initialize the configuration.
+        
+        Args:
+            config_data (Dict[str, Any]): Configuration dictionary keyed by section
+        """
+        self.config_data = config_data
+    
+    def get_section(self, section: str) -> Dict[str, Any]:
+        """
+        Get a configuration section.
+        
+        Args:
+            section (str): Configuration section
+            
+        Returns:
+            Dict[str, Any]: Configuration section, or an empty dictionary if not found
+        """
+        return self.config_data.get(section, {})
 
 
 def get_last_incident_id_from_ssm() -> int:
@@ -31,7 +59,7 @@ def get_last_incident_id_from_ssm() -> int:
         int: Last processed incident ID, or 0 if none found
     """
     try:
-        ssm = boto3.client('ssm')
+        ssm = get_ssm_client()
         parameter_name = '/ops-api/last-incident-id'
         
         try:
@@ -61,7 +89,7 @@ def update_last_incident_id_in_ssm(incident_id: int) -> None:
     """
     try:
         # Store in AWS Systems Manager Parameter Store
-        ssm = boto3.client('ssm')
+        ssm = get_ssm_client()
         parameter_name = '/ops-api/last-incident-id'
         
         ssm.put_parameter(
@@ -132,8 +160,8 @@ def main():
     
     This function orchestrates the entire workflow:
     1. Parse command line arguments
-    2. Set up logging
-    3. Load configuration
+    2. Load configuration
+    3. Set up logging
     4. Get the last run time
     5. Authenticate with Archer and get SIR data
     6. Preprocess the data
@@ -142,52 +170,52 @@ def main():
     # Parse command line arguments
     args = parse_args()
     
-    # Set up logging
     # If log level is specified in command line, use it; otherwise, use environment variable
     log_level = getattr(logging, args.log_level) if args.log_level else None
-    logger = setup_logging(log_level=log_level, log_file=args.log_file)
+    
+    # Logging is set up once, after the configuration it can read (secrets or .env
+    # variables) has been loaded
+    logger = None
     
     try:
-        logger.info("Starting OPS API")
-        
         # Load configuration based on environment
         environment = os.environ.get('ENVIRONMENT', 'development')
+        config_dict = None
+        env_file_loaded = None
         
         if environment in ['preproduction', 'production']:
             # Load configuration from AWS Secrets Manager
-            logger.info(f"Loading configuration from AWS Secrets Manager for {environment} environment")
             config_dict = load_config_from_secrets()
-            
-            # Create a simple config object that mimics the Config class interface
-            class SecretsConfig:
-                def __init__(self, config_data):
-                    self.config_data = config_data
-                
-                def get_section(self, section):
-                    return self.config_data.get(section, {})
-            
             config = SecretsConfig(config_dict)
-            
-            # Update logging configuration with the loaded config
-            logger = setup_logging(log_level=None, log_file=args.log_file, config=config_dict)
         else:
             # Load configuration from files and environment variables (development)
-            logger.info("Loading configuration from files and environment variables for development")
-            
             # Load .env file if specified
             env_file = args.env_file or os.path.join(os.path.dirname(os.path.dirname(__file__)), '.env')
             if env_file and os.path.exists(env_file):
                 from dotenv import load_dotenv
                 load_dotenv(env_file)
-                logger.info(f"Loaded environment variables from {env_file}")
+                env_file_loaded = env_file
             
             config = get_config(args.config)
-            
-            # Update logging configuration with environment variables (now loaded from .env)
-            logger = setup_logging(log_level=None, log_file=args.log_file)
+        
+        # Set up logging with the loaded configuration
+        logger = setup_logging(log_level=log_level, log_file=args.log_file, config=config_dict)
+        logger.info("Starting OPS API")
+        
+        if config_dict is not None:
+            logger.info(f"Loaded configuration from AWS Secrets Manager for {environment} environment")
+        else:
+            logger.info("Loaded configuration from files and environment variables for development")
+            if env_file_loaded:
+                logger.info(f"Loaded environment variables from {env_file_loaded}")
         
         logger.info(f"Configuration loaded successfully for {environment} environment")
         
+        # Look up each section once and reuse it below
+        archer_config, processing_config, ops_portal_config = (
+            config.get_section(section) for section in ('archer', 'processing', 'ops_portal')
+        )
+        
         # Get the last processed incident ID from SSM Parameter Store
         last_incident_id = get_last_incident_id_from_ssm()
         logger.info(f"Last processed incident ID: {last_incident_id}")
@@ -197,7 +225,6 @@ def main():
         logger.info(f"Last run time: {last_run_time}")
         
         # Authenticate with Archer and get SIR data
-        archer_config = config.get_section('archer')
         archer = get_archer_auth(archer_config)
         
         logger.info("Retrieving SIR data from Archer")
@@ -205,24 +232,22 @@ def main():
         logger.info(f"Retrieved {len(raw_data)} records from Archer")
         
         # Preprocess the data
-        processing_config = config.get_section('processing')
         processed_data = preprocess(raw_data, last_incident_id, processing_config)
         logger.info(f"Processed {len(processed_data)} records")
         
         # Send the processed data to the OPS Portal
         if not processed_data.empty:
-            records = processed_data.to_dict('records')
+            record_count = len(processed_data)
             
             if args.dry_run:
-                logger.info(f"Dry run: Would send {len(records)} records to OPS Portal")
+                logger.info(f"Dry run: Would send {record_count} records to OPS Portal")
             else:
-                logger.info(f"Sending {len(records)} records to OPS Portal")
-                ops_portal_config = config.get_section('ops_portal')
-                responses = send(records, ops_portal_config)
+                logger.info(f"Sending {record_count} records to OPS Portal")
+                responses = send(iter_records(processed_data), ops_portal_config)
                 
                 # Log results
                 success_count = sum(1 for status, _ in responses.values() if 200 <= status < 300)
-                logger.info(f"Successfully sent {success_count} of {len(records)} records")
+                logger.info(f"Successfully sent {success_count} of {record_count} records")
                 
                 # Log failures
                 for id, (status, response) in responses.items():
@@ -233,8 +258,12 @@ def main():
         
         # Update the last processed incident ID if we processed any records
         if not processed_data.empty and 'Incident_ID' in processed_data.columns:
-            # Find the highest incident ID from the processed records
-            max_incident_id = processed_data['Incident_ID'].max()
+            # Use the highest incident ID recorded by preprocess, scanning the column only
+            # if it wasn't recorded
+            if 'max_incident_id' in processed_data.attrs:
+                max_incident_id = processed_data.attrs['max_incident_id']
+            else:
+                max_incident_id = processed_data['Incident_ID'].max()
             if max_incident_id is not None and max_incident_id > last_incident_id:
                 update_last_incident_id_in_ssm(int(max_incident_id))
                 logger.info(f"Updated last processed incident ID to: {max_incident_id}")
@@ -248,6 +277,8 @@ def main():
         return 0
         
     except Exception as e:
+        if logger is None:
+            logger = setup_logging(log_level=log_level, log_file=args.log_file)
         logger.exception(f"Error in OPS API: {str(e)}")
         return 1
 
@@ -6,25 +6,284 @@ It provides functionality to authenticate with the API and send records to the O
 """
 
 import requests
+import base64
+import hashlib
+import json
 import logging
 import ssl
 import tempfile
+import threading
+import time
 import os
-from typing import Dict, List, Tuple, Any, Optional
+import weakref
+from functools import lru_cache
+from itertools import islice
+from urllib.parse import urlsplit
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Iterable, List, Tuple, Any, Optional
 from requests.adapters import HTTPAdapter
 from urllib3.util import ssl_
+from urllib3.util.retry import Retry
 from ..utils.logging_utils import get_logger
 
 try:
-    from cryptography.hazmat.primitives import serialization
-    from cryptography.hazmat.primitives.serialization import pkcs12
-    CRYPTOGRAPHY_AVAILABLE = True
+    import orjson
+    ORJSON_AVAILABLE = True
 except ImportError:
-    CRYPTOGRAPHY_AVAILABLE = False
+    ORJSON_AVAILABLE = False
 
 # Get logger for this module
 logger = get_logger('ops_portal.api')
 
+# PEM certificate chain and private key extracted from PKCS#12 data, keyed by a SHA-256
+# digest of the data and password
+_pem_cache: Dict[str, Tuple[bytes, bytes]] = {}
+
+# Clients reused across send() calls, keyed by a digest of their configuration
+_clients: Dict[str, 'OpsPortalClient'] = {}
+_clients_lock = threading.Lock()
+
+# Transient HTTP statuses retried with exponential backoff. POSTs are retried, so only
+# statuses meaning the request was not processed are listed: after a 500, 502 or 504
+# the item may already have been created, and a retry could create a duplicate.
+RETRY_STATUS_CODES = (429, 503)
+
+# Seconds before a token's expiry at which it is treated as expired and renewed
+TOKEN_EXPIRY_MARGIN = 60
+
+# Statuses with which the item endpoint rejects an array of records, meaning it only
+# accepts one record per request
+BATCH_UNSUPPORTED_STATUS_CODES = (400, 415)
+
+# Records per request when batching without an explicit batch_size
+DEFAULT_BATCH_SIZE = 100
+
+# Keys a batch response item may report its own HTTP status under
+_BATCH_ITEM_STATUS_KEYS = ('status', 'statusCode', 'status_code')
+
+# Error messages for client error statuses returned when sending a record
+_RECORD_ERROR_MESSAGES = {
+    401: "Authentication failed when sending record {record_id} - token may have expired",
+    403: "Access forbidden when sending record {record_id} - check permissions",
+    404: "Item endpoint not found when sending record {record_id} - check item_url",
+}
+
+
+@lru_cache(maxsize=1)
+def _disable_insecure_request_warnings() -> None:
+    """
+    Silence urllib3's warning for unverified HTTPS requests, once per process.
+    """
+    import urllib3
+    urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+
+
+def _remove_files(*paths: str) -> None:
+    """
+    Remove temporary files, ignoring any that are already gone.
+    
+    Args:
+        *paths (str): Paths of the files to remove
+    """
+    for path in paths:
+        try:
+            os.unlink(path)
+        except OSError:
+            pass
+
+
+def _write_pem_files(cert_pem: bytes, key_pem: bytes) -> Tuple[str, str]:
+    """
+    Write a PEM certificate chain and private key to temporary files readable only by
+    the current user.
+    
+    Args:
+        cert_pem (bytes): PEM certificate chain
+        key_pem (bytes): PEM private key
+        
+    Returns:
+        Tuple[str, str]: Paths of the certificate chain and key files
+    """
+    cert_fd, cert_path = tempfile.mkstemp(suffix='.pem')
+    key_fd, key_path = tempfile.mkstemp(suffix='.key')
+    try:
+        with os.fdopen(cert_fd, 'wb') as cert_file:
+            cert_file.write(cert_pem)
+        with os.fdopen(key_fd, 'wb') as key_file:
+            key_file.write(key_pem)
+        os.chmod(cert_path, 0o600)
+        os.chmod(key_path, 0o600)
+    except Exception:
+        _remove_files(cert_path, key_path)
+        raise
+    return cert_path, key_path
+
+
+def _token_expiry(token: Any) -> Optional[float]:
+    """
+    Read the expiry time from a JWT bearer token without verifying it.
+    
+    Args:
+        token (Any): Token returned by the authentication endpoint
+        
+    Returns:
+        Optional[float]: Expiry as a POSIX timestamp, or None if the token is not a JWT
+            with an exp claim
+    """
+    if not isinstance(token, str) or token.count('.') != 2:
+        return None
+    try:
+        payload = token.split('.')[1]
+        # JWTs use unpadded base64url
+        claims = json.loads(base64.urlsafe_b64decode(payload + '=' * (-len(payload) % 4)))
+        return float(claims['exp'])
+    except (ValueError, TypeError, KeyError):
+        return None
+
+
+def _parse_body(response: requests.Response) -> Any:
+    """
+    Decode a response body as JSON when the server declares it as JSON, otherwise
+    return the text (e.g. an HTML error page).
+    
+    The raw bytes are parsed directly, and text is decoded with the declared charset
+    (UTF-8 if none), which avoids requests' charset detection in response.text.
+    
+    Args:
+        response (requests.Response): HTTP response
+        
+    Returns:
+        Any: Decoded JSON data, or the response text
+    """
+    content = response.content
+    if 'json' in response.headers.get('Content-Type', ''):
+        try:
+            return _loads(content)
+        except ValueError:
+            pass
+    return content.decode(response.encoding or 'utf-8', 'replace')
+
+
+def _record_id(record: Dict[str, Any], index: int) -> str:
+    """
+    Get the ID a record's result is reported under.
+    
+    Args:
+        record (Dict[str, Any]): Record data
+        index (int): Position of the record among those being sent
+        
+    Returns:
+        str: The record's tenantItemID, or 'unknown_<index>' if it has none
+    """
+    record_id = record.get('tenantItemID')
+    if record_id is None:
+        # Only format a placeholder for records that need one
+        return f'unknown_{index}'
+    return record_id
+
+
+def _batch_item_results(body: Any, count: int, status_code: int) -> Optional[List[Tuple[int, Any]]]:
+    """
+    Split a batch response into one (status_code, response_data) result per record.
+    
+    The body must be a JSON array, or an object with a 'results' array, holding one
+    item per record in the order they were sent. An item's status is read from
+    _BATCH_ITEM_STATUS_KEYS, and items without one take the status of the whole
+    response. Failed items keep the item as their response data.
+    
+    Args:
+        body (Any): Parsed response body
+        count (int): Number of records in the batch
+        status_code (int): HTTP status of the batch response
+        
+    Returns:
+        Optional[List[Tuple[int, Any]]]: Per-record results, or None if the body
+            doesn't hold one item per record
+    """
+    if isinstance(body, dict):
+        body = body.get('results')
+    if not isinstance(body, list) or len(body) != count:
+        return None
+    
+    results = []
+    for item in body:
+        item_status = status_code
+        if isinstance(item, dict):
+            for key in _BATCH_ITEM_STATUS_KEYS:
+                if isinstance(item.get(key), int):
+                    item_status = item[key]
+                    break
+        results.append((item_status, None if 200 <= item_status < 300 else item))
+    return results
+
+
+def _tls_version(response: requests.Response) -> str:
+    """
+    Get the TLS version negotiated on the connection a response arrived on.
+    
+    Args:
+        response (requests.Response): HTTP response
+        
+    Returns:
+        str: TLS version, or 'Unknown' if the connection isn't available
+    """
+    connection = getattr(response.raw, 'connection', None)
+    if connection is not None and hasattr(connection, 'socket'):
+        return connection.socket.version()
+    return 'Unknown'
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """
+    Serialize a request body to JSON bytes with the standard library, using the
+    same settings requests applies for json= bodies.
+    
+    Args:
+        obj (Any): JSON-serializable object
+        
+    Returns:
+        bytes: UTF-8 encoded JSON
+    """
+    return json.dumps(obj, allow_nan=False).encode('utf-8')
+
+
+# Response body parser: orjson when it is installed; both accept bytes directly
+_loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+
+# Request body serializer, chosen once: orjson when it is installed, which encodes
+# straight to bytes, otherwise the standard library
+_dumps = orjson.dumps if ORJSON_AVAILABLE else _json_dumps
+
+
+class TLSv12Adapter(HTTPAdapter):
+    """
+    HTTPS adapter that opens every connection with one shared SSL context.
+    
+    The context is built once by OpsPortalClient and already trusts the CA bundle,
+    so the bundle is not reloaded into it for each new connection.
+    """
+    
+    def __init__(self, *args, ssl_context: ssl.SSLContext, **kwargs):
+        # Store the shared SSL context before the pool manager is created
+        self.ssl_context = ssl_context
+        super().__init__(*args, **kwargs)
+    
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs['ssl_context'] = self.ssl_context
+        return super().init_poolmanager(*args, **kwargs)
+    
+    def proxy_manager_for(self, *args, **kwargs):
+        kwargs['ssl_context'] = self.ssl_context
+        return super().proxy_manager_for(*args, **kwargs)
+    
+    def cert_verify(self, conn, url, verify, cert):
+        super().cert_verify(conn, url, verify, cert)
+        # With the default bundle, urllib3 would call load_verify_locations on the
+        # shared context for every new connection; the context already trusts it
+        if verify is True:
+            conn.ca_certs = None
+            conn.ca_cert_dir = None
+
 
 class OpsPortalClient:
     """
@@ -49,17 +308,39 @@ class OpsPortalClient:
                 - cert_pfx: Path to PKCS#12 (.pfx) certificate file
                 - pfx_password: Password for the PKCS#12 file
                 - cert_pfx_data: Binary PKCS#12 certificate data from AWS Secrets Manager
+                - max_workers: Maximum number of records sent concurrently (default: 8)
+                - batch_size: Number of records sent per request by send(); 0 sends
+                  one record per request unless batch_url is set (default: 0)
+                - batch_url: URL that accepts arrays of records; when set, send()
+                  batches records to it (default: item_url)
         """
         self.auth_url = config.get('auth_url')
         self.item_url = config.get('item_url')
         self.client_id = config.get('client_id', '')
         self.client_secret = config.get('client_secret', '')
+        # The credentials don't change, so serialize the authentication body once.
+        # Use lowercase field names as shown in the reference example
+        self._auth_body = _dumps({
+            'clientId': self.client_id,
+            'clientSecret': self.client_secret
+        })
         self.verify_ssl = config.get('verify_ssl', True)
         # Support both cert_pfx and cert_path for the PKCS#12 certificate file
         self.cert_pfx = config.get('cert_pfx') or config.get('cert_path')
         self.pfx_password = config.get('pfx_password')
+        # Password for the .pfx file as bytes, without any surrounding quotes
+        pfx_password = (self.pfx_password or '').strip("'\"")
+        self._pfx_password_bytes = pfx_password.encode('utf-8') if pfx_password else None
         # Certificate data from AWS Secrets Manager
         self.cert_pfx_data = config.get('cert_pfx_data')
+        # Number of records sent concurrently by send_records
+        self.max_workers = int(config.get('max_workers', 8))
+        # Number of records sent() posts as one array; 0 disables batching
+        self.batch_size = int(config.get('batch_size', 0))
+        # Bulk endpoint for arrays of records, if the API has a separate one
+        self.batch_url = config.get('batch_url')
+        # Cleared once the item endpoint rejects an array of records
+        self._batch_supported = True
         
         # Validate required configuration
         if not self.auth_url:
@@ -67,13 +348,17 @@ class OpsPortalClient:
         if not self.item_url:
             raise ValueError("Missing required configuration: item_url")
         
+        # Connections are pooled per scheme and host, so a token request doesn't open
+        # the connection used for items when they are served from another host
+        self._item_host_differs = urlsplit(self.auth_url)[:2] != urlsplit(self.item_url)[:2]
+        
         # Set up session
         self.session = requests.session()
         self.session.headers.update({
             'Accept': 'application/json',
+            'Accept-Encoding': 'gzip, deflate',
             'Content-Type': 'application/json',
             'User-Agent': 'OPS-Portal-Client/1.0 (Python/requests)',
-            'Cache-Control': 'no-cache',
             'Connection': 'keep-alive'
         })
         
@@ -83,15 +368,23 @@ class OpsPortalClient:
         else:
             self.session.verify = False
             # Disable SSL warnings when verification is disabled
-            import urllib3
-            urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+            _disable_insecure_request_warnings()
+        
+        # Client certificate chain (PEM) and the SSL context it is loaded into
+        self.client_cert_pem = None
+        self._ssl_context = None
         
         # Configure TLS version and SSL certificate
         self._configure_tls_version()
         self._configure_ssl_certificate()
         
-        # Token will be set during authentication
+        # Token and its expiry (for JWTs) will be set during authentication
         self.token = None
+        self.token_expiry = None
+        # TLS version negotiated for the token request, recorded when DEBUG logging is on
+        self._tls_version = None
+        # Serializes re-authentication when several workers see an expired token
+        self._auth_lock = threading.Lock()
     
     def _configure_tls_version(self):
         """
@@ -101,46 +394,42 @@ class OpsPortalClient:
         as the minimum version to use for the HTTPS connection.
         """
         try:
-            # Create a custom SSL context with TLS 1.2
-            class TLSv12Adapter(HTTPAdapter):
-                def __init__(self, *args, **kwargs):
-                    # Store verify setting from the session
-                    self.verify = kwargs.pop('verify', True)
-                    super().__init__(*args, **kwargs)
-                def init_poolmanager(self, *args, **kwargs):
-                    context = ssl_.create_urllib3_context(ssl_version=ssl.PROTOCOL_TLSv1_2)
-                    # Disable older protocols
-                    context.options |= ssl.OP_NO_SSLv2
-                    context.options |= ssl.OP_NO_SSLv3
-                    context.options |= ssl.OP_NO_TLSv1
-                    context.options |= ssl.OP_NO_TLSv1_1
-                    
-                    # Handle hostname verification based on verify_ssl setting
-                    if not self.verify:
-                        context.check_hostname = False
-                        context.verify_mode = ssl.CERT_NONE
-                    
-                    kwargs['ssl_context'] = context
-                    return super().init_poolmanager(*args, **kwargs)
-                
-                def proxy_manager_for(self, *args, **kwargs):
-                    context = ssl_.create_urllib3_context(ssl_version=ssl.PROTOCOL_TLSv1_2)
-                    # Disable older protocols
-                    context.options |= ssl.OP_NO_SSLv2
-                    context.options |= ssl.OP_NO_SSLv3
-                    context.options |= ssl.OP_NO_TLSv1
-                    context.options |= ssl.OP_NO_TLSv1_1
-                    
-                    # Handle hostname verification based on verify_ssl setting
-                    if not self.verify:
-                        context.check_hostname = False
-                        context.verify_mode = ssl.CERT_NONE
-                    
-                    kwargs['ssl_context'] = context
-                    return super().proxy_manager_for(*args, **kwargs)
-            
-            # Mount the adapter for all HTTPS requests with verify setting
-            self.session.mount('https://', TLSv12Adapter(verify=self.verify_ssl))
+            # Build one SSL context for every connection the session opens; the client
+            # certificate is loaded into it once by _configure_pfx_certificate
+            ssl_context = self._create_ssl_context()
+            
+            # Retry transient server errors with exponential backoff, returning the last
+            # response (rather than raising) so send_record's status handling still applies.
+            # Failed connections are retried, since nothing was sent, but errors after the
+            # request went out are not: the POST may already have created the item.
+            retry = Retry(
+                total=3,
+                read=0,
+                other=0,
+                backoff_factor=0.5,
+                status_forcelist=RETRY_STATUS_CODES,
+                allowed_methods=frozenset(['GET', 'POST']),
+                respect_retry_after_header=True,
+                raise_on_status=False
+            )
+            
+            # Size the connection pool for the concurrent senders in send_records
+            pool_size = max(self.max_workers, 10)
+            
+            # Mount the adapter for all HTTPS requests with the shared SSL context
+            self.session.mount('https://', TLSv12Adapter(
+                ssl_context=ssl_context,
+                pool_connections=pool_size,
+                pool_maxsize=pool_size,
+                max_retries=retry
+            ))
+            # Plain HTTP (e.g. a local test portal) gets the same pool size and retries
+            self.session.mount('http://', HTTPAdapter(
+                pool_connections=pool_size,
+                pool_maxsize=pool_size,
+                max_retries=retry
+            ))
+            self._ssl_context = ssl_context
             logger.info("TLS 1.2 explicitly configured for HTTPS connections")
             
         except Exception as e:
@@ -148,12 +437,72 @@ class OpsPortalClient:
             logger.warning("Using default TLS version configuration")
     
     
+    def _create_ssl_context(self) -> ssl.SSLContext:
+        """
+        Create the SSL context used for all HTTPS connections.
+        
+        The context requires TLS 1.2 or later. It loads the CA bundle requests uses
+        once, or disables hostname and certificate verification when verify_ssl is
+        False.
+        
+        Returns:
+            ssl.SSLContext: SSL context
+        """
+        context = ssl_.create_urllib3_context(ssl_version=ssl.PROTOCOL_TLSv1_2)
+        # Disable older protocols
+        context.options |= ssl.OP_NO_SSLv2
+        context.options |= ssl.OP_NO_SSLv3
+        context.options |= ssl.OP_NO_TLSv1
+        context.options |= ssl.OP_NO_TLSv1_1
+        
+        # Handle hostname verification based on verify_ssl setting
+        if self.verify_ssl:
+            context.load_verify_locations(cafile=requests.certs.where())
+        else:
+            context.check_hostname = False
+            context.verify_mode = ssl.CERT_NONE
+        
+        return context
+    
+    def _use_client_certificate(self, cert_pem: bytes, key_pem: bytes) -> None:
+        """
+        Present the given client certificate on every HTTPS connection.
+        
+        The certificate is loaded into the shared SSL context once. The ssl module can
+        only load certificates from files, so the PEM data is written to temporary
+        files that are removed as soon as it has been loaded. If the shared context is
+        not available, the files are kept and set on the session instead, which makes
+        urllib3 load them for each new connection; they are then removed when the
+        client is garbage collected or the process exits.
+        
+        Args:
+            cert_pem (bytes): PEM certificate chain
+            key_pem (bytes): PEM private key
+        """
+        self.client_cert_pem = cert_pem
+        cert_path, key_path = _write_pem_files(cert_pem, key_pem)
+        
+        if self._ssl_context is not None:
+            try:
+                self._ssl_context.load_cert_chain(certfile=cert_path, keyfile=key_path)
+            finally:
+                _remove_files(cert_path, key_path)
+            logger.info("SSL client certificate loaded into the session's SSL context")
+        else:
+            self.session.cert = (cert_path, key_path)
+            weakref.finalize(self, _remove_files, cert_path, key_path)
+            logger.info(f"SSL client certificate configured from files {cert_path} and {key_path}")
+    
     def log_certificate_format_details(self):
         """
         Log detailed information about the x509 certificate format being used.
         This method can be called to get comprehensive certificate format information.
         """
-        if not self.session.cert:
+        # Everything here is logged at INFO; don't parse the certificate if it is discarded
+        if not logger.isEnabledFor(logging.INFO):
+            return
+        
+        if not self.client_cert_pem:
             logger.info("No X.509 client certificate configured")
             return
         
@@ -162,32 +511,22 @@ class OpsPortalClient:
         logger.info("Usage: Mutual TLS (mTLS) authentication with OPS Portal API")
         logger.info("Transport: TLS/SSL layer during HTTPS requests")
         
-        if isinstance(self.session.cert, tuple) and len(self.session.cert) == 2:
-            cert_path, key_path = self.session.cert
-            logger.info(f"Certificate file: {cert_path}")
-            logger.info(f"Private key file: {key_path}")
+        # Analyze the end-entity certificate, the first one in the chain
+        try:
+            from cryptography import x509
+            from cryptography.hazmat.primitives import hashes
+            certificate = x509.load_pem_x509_certificate(self.client_cert_pem)
+            logger.info(f"Certificate Subject: {certificate.subject}")
+            logger.info(f"Certificate Issuer: {certificate.issuer}")
+            logger.info(f"Certificate Serial: {certificate.serial_number}")
+            logger.info(f"Certificate Valid Until: {certificate.not_valid_after_utc}")
             
-            # Try to read and analyze the certificate file if it exists
-            try:
-                if os.path.exists(cert_path):
-                    with open(cert_path, 'r') as f:
-                        cert_content = f.read()
-                    
-                    if CRYPTOGRAPHY_AVAILABLE:
-                        from cryptography import x509
-                        from cryptography.hazmat.primitives import hashes
-                        certificate = x509.load_pem_x509_certificate(cert_content.encode('utf-8'))
-                        logger.info(f"Certificate Subject: {certificate.subject}")
-                        logger.info(f"Certificate Issuer: {certificate.issuer}")
-                        logger.info(f"Certificate Serial: {certificate.serial_number}")
-                        logger.info(f"Certificate Valid Until: {certificate.not_valid_after_utc}")
-                        
-                        # Log certificate fingerprint for identification
-                        sha256_fingerprint = certificate.fingerprint(hashes.SHA256()).hex()
-                        logger.info(f"Certificate SHA256 Fingerprint: {sha256_fingerprint}")
-                        
-            except Exception as e:
-                logger.warning(f"Could not analyze certificate file: {e}")
+            # Log certificate fingerprint for identification
+            sha256_fingerprint = certificate.fingerprint(hashes.SHA256()).hex()
+            logger.info(f"Certificate SHA256 Fingerprint: {sha256_fingerprint}")
+                
+        except Exception as e:
+            logger.warning(f"Could not analyze certificate: {e}")
         
         logger.info("=== End X509 Certificate Configuration ===")
     
@@ -226,19 +565,16 @@ class OpsPortalClient:
         1. File system: Using self.cert_pfx path to load the certificate from a file
         2. AWS Secrets Manager: Using self.cert_pfx_data binary data directly
         """
-        if not CRYPTOGRAPHY_AVAILABLE:
+        # Imported here so clients without a PKCS#12 certificate don't pay for loading it
+        try:
+            from cryptography.hazmat.primitives import serialization
+            from cryptography.hazmat.primitives.serialization import pkcs12
+        except ImportError:
             logger.error("cryptography library not available - cannot handle PKCS#12 certificates")
             raise ImportError("cryptography library required for PKCS#12 certificate handling")
         
         try:
-            # Get the password for the .pfx file
-            pfx_password = getattr(self, 'pfx_password', None)
-            if pfx_password:
-                # Remove surrounding quotes if present
-                pfx_password = pfx_password.strip("'\"")
-            
-            # Convert password to bytes if it's not None
-            password_bytes = pfx_password.encode('utf-8') if pfx_password else None
+            password_bytes = self._pfx_password_bytes
             
             # Determine the source of the certificate (file or binary data)
             if self.cert_pfx_data:
@@ -254,64 +590,45 @@ class OpsPortalClient:
                 logger.error("No PKCS#12 certificate source available")
                 raise ValueError("No PKCS#12 certificate source available")
             
+            # Reuse the PEM data already extracted for this certificate and password
+            digest = hashlib.sha256(pfx_data + b'\0' + (password_bytes or b'')).hexdigest()
+            pem = _pem_cache.get(digest)
+            if pem is not None:
+                self._use_client_certificate(*pem)
+                logger.info("SSL client certificate configured from previously extracted PKCS#12 data")
+                return
+            
             # Load the PKCS#12 data
             private_key, certificate, additional_certificates = pkcs12.load_key_and_certificates(
                 pfx_data, 
                 password_bytes
             )
             
+            additional_certificates = additional_certificates or []
             logger.info("Successfully parsed PKCS#12 data")
-            logger.info(f"Certificate subject: {certificate.subject}")
-            logger.info(f"Certificate issuer: {certificate.issuer}")
-            logger.info(f"Additional certificates in chain: {len(additional_certificates) if additional_certificates else 0}")
             
-            # Create temporary files for the certificate chain and key
-            cert_chain_fd, cert_chain_path = tempfile.mkstemp(suffix='.pem')
-            key_fd, key_path = tempfile.mkstemp(suffix='.key')
+            # Formatting the certificate names decodes them, so only do it when logged
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(f"Certificate subject: {certificate.subject}")
+                logger.info(f"Certificate issuer: {certificate.issuer}")
+                logger.info(f"Additional certificates in chain: {len(additional_certificates)}")
+                for i, additional_cert in enumerate(additional_certificates):
+                    logger.info(f"Added certificate {i+1} to chain: {additional_cert.subject}")
             
-            try:
-                # Write the certificate chain to a temporary file
-                # Start with the end-entity certificate
-                with os.fdopen(cert_chain_fd, 'wb') as cert_chain_file:
-                    # Write the end-entity certificate
-                    cert_chain_file.write(certificate.public_bytes(serialization.Encoding.PEM))
-                    
-                    # Write all additional certificates in the chain
-                    if additional_certificates:
-                        for i, additional_cert in enumerate(additional_certificates):
-                            cert_chain_file.write(additional_cert.public_bytes(serialization.Encoding.PEM))
-                            logger.info(f"Added certificate {i+1} to chain: {additional_cert.subject}")
-                
-                # Write the private key to a temporary file
-                with os.fdopen(key_fd, 'wb') as key_file:
-                    key_file.write(private_key.private_bytes(
-                        serialization.Encoding.PEM,
-                        serialization.PrivateFormat.PKCS8,
-                        serialization.NoEncryption()
-                    ))
-                
-                # Set proper file permissions for security
-                os.chmod(cert_chain_path, 0o600)
-                os.chmod(key_path, 0o600)
-                
-                # Configure the session with the temporary files
-                self.session.cert = (cert_chain_path, key_path)
-                logger.info("SSL client certificate configured from PKCS#12 file with complete certificate chain")
-                logger.info(f"Certificate chain file: {cert_chain_path}")
-                logger.info(f"Key file: {key_path}")
-                
-                # Store paths for cleanup (if needed)
-                self._temp_cert_path = cert_chain_path
-                self._temp_key_path = key_path
-                
-            except Exception as e:
-                # Clean up temporary files on error
-                try:
-                    os.unlink(cert_chain_path)
-                    os.unlink(key_path)
-                except:
-                    pass
-                raise e
+            # Build the certificate chain, starting with the end-entity certificate
+            cert_pem = b''.join(
+                cert.public_bytes(serialization.Encoding.PEM)
+                for cert in [certificate, *additional_certificates]
+            )
+            key_pem = private_key.private_bytes(
+                serialization.Encoding.PEM,
+                serialization.PrivateFormat.PKCS8,
+                serialization.NoEncryption()
+            )
+            
+            self._use_client_certificate(cert_pem, key_pem)
+            _pem_cache[digest] = (cert_pem, key_pem)
+            logger.info("SSL client certificate configured from PKCS#12 file with complete certificate chain")
                 
         except Exception as e:
             logger.error(f"Failed to configure PKCS#12 certificate: {str(e)}")
@@ -328,10 +645,10 @@ class OpsPortalClient:
         try:
             logger.info(f"Authenticating with OPS Portal API at {self.auth_url}")
             logger.info(f"SSL verification enabled: {self.verify_ssl}")
-            logger.info(f"Client certificate configured: {bool(self.session.cert)}")
+            logger.info(f"Client certificate configured: {bool(self.client_cert_pem)}")
             
             # Log x509 certificate usage for OPS API
-            if self.session.cert:
+            if self.client_cert_pem:
                 logger.info("=== X509 Certificate Usage for OPS API ===")
                 logger.info("Using X.509 client certificate for mutual TLS authentication")
                 if isinstance(self.session.cert, tuple) and len(self.session.cert) == 2:
@@ -341,48 +658,55 @@ class OpsPortalClient:
                 logger.info("Certificate will be sent to OPS Portal API for client authentication")
                 logger.info("=== End X509 Certificate Usage ===")
             
-            # Use lowercase field names as shown in the reference example
-            creds = {
-                'clientId': self.client_id,
-                'clientSecret': self.client_secret
-            }
-            
             if self.client_id:
                 logger.debug(f"Authentication payload: clientId={self.client_id[:8]}...")
             else:
                 logger.debug("Authentication payload: clientId=<empty>")
             
+            # The session already sends Content-Type: application/json
             response = self.session.post(
                 self.auth_url,
-                json=creds,
+                data=self._auth_body,
                 timeout=30  # Add timeout to prevent hanging
             )
             
             logger.info(f"Authentication response status: {response.status_code}")
-            logger.debug(f"TLS version used: {response.raw.connection.socket.version() if hasattr(response.raw, 'connection') and hasattr(response.raw.connection, 'socket') else 'Unknown'}")
+            # Record the TLS version once per token rather than probing every record
+            if logger.isEnabledFor(logging.DEBUG):
+                self._tls_version = _tls_version(response)
+                logger.debug(f"TLS version used: {self._tls_version}")
             
-            response.raise_for_status()
+            if response.status_code >= 400:
+                self._log_auth_error(response)
+                return False
             
-            # The response should contain the token directly
-            # Store the token string, not the entire response
-            token_response = response.json()
-            
-            # Handle both string token and object response formats
-            if isinstance(token_response, str):
-                self.token = token_response
-            elif isinstance(token_response, dict) and 'token' in token_response:
-                self.token = token_response['token']
-            elif isinstance(token_response, dict) and 'access_token' in token_response:
-                self.token = token_response['access_token']
+            # Some deployments also return the token in a response header; use it when
+            # present so the body doesn't need decoding (this also handles 204 responses)
+            header_token = response.headers.get('X-Auth-Token') or response.headers.get('Authorization')
+            if header_token:
+                token = header_token[len('Bearer '):] if header_token.startswith('Bearer ') else header_token
             else:
-                # If response is not a string, treat the whole response as the token
-                # This matches the reference example behavior
-                self.token = token_response
+                # The response should contain the token directly
+                # Store the token string, not the entire response
+                token_response = response.json()
+                
+                # Handle both string token and object response formats
+                if isinstance(token_response, dict) and 'token' in token_response:
+                    token = token_response['token']
+                elif isinstance(token_response, dict) and 'access_token' in token_response:
+                    token = token_response['access_token']
+                else:
+                    # If response is not a string, treat the whole response as the token
+                    # This matches the reference example behavior
+                    token = token_response
+            
+            # Store the token as the string sent in the header, so an unexpected
+            # response shape is formatted once here rather than on every request
+            self.token = token if isinstance(token, str) else str(token)
+            self.token_expiry = _token_expiry(self.token)
             
             # Update session headers with the authorization token
-            self.session.headers.update(
-                {'Authorization': f'Bearer {self.token}'}
-            )
+            self.session.headers['Authorization'] = f'Bearer {self.token}'
             
             logger.info("Authentication successful")
             logger.debug(f"Token type: {type(self.token)}")
@@ -391,109 +715,118 @@ class OpsPortalClient:
         except requests.exceptions.RequestException as e:
             logger.error(f"Authentication failed: {str(e)}")
             
-            # Handle specific error cases
-            if hasattr(e, 'response') and e.response is not None:
-                status_code = e.response.status_code
-                
-                # Check for service downtime indicators
-                if status_code >= 500:
-                    logger.error(f"OPS Portal service appears to be down (HTTP {status_code})")
-                    
-                    # Check for specific ASP.NET Core startup errors
-                    if 'ASP.NET Core app failed to start' in e.response.text:
-                        logger.error("Service startup failure detected - ASP.NET Core app failed to start within timeout")
-                        logger.warning("This is a server-side issue. The service may be undergoing maintenance or experiencing technical difficulties.")
-                    elif 'Internal Server Error' in e.response.text:
-                        logger.error("Internal server error detected - service may be temporarily unavailable")
-                    else:
-                        logger.error(f"Server error {status_code} - service may be experiencing issues")
-                        
-                elif status_code == 404:
-                    logger.error("Authentication endpoint not found - check if the auth_url is correct")
-                elif status_code == 403:
-                    logger.error("Access forbidden - check client credentials or SSL certificate")
-                elif status_code == 401:
-                    logger.error("Authentication failed - invalid client credentials")
-                else:
-                    logger.error(f"HTTP {status_code} error during authentication")
-                
-                # Log response details for debugging
-                try:
-                    error_detail = e.response.json()
-                    logger.debug(f"Error response JSON: {error_detail}")
-                except:
-                    # For HTML error pages (like the ASP.NET error), just log a snippet
-                    response_text = e.response.text
-                    if len(response_text) > 500:
-                        logger.debug(f"Error response text (truncated): {response_text[:500]}...")
-                    else:
-                        logger.debug(f"Error response text: {response_text}")
-            else:
-                # Network-level errors (connection timeout, DNS issues, etc.)
-                logger.error("Network error during authentication - check connectivity to OPS Portal service")
-                
+            # Network-level errors (connection timeout, DNS issues, etc.)
+            logger.error("Network error during authentication - check connectivity to OPS Portal service")
             return False
         except Exception as e:
             logger.error(f"Unexpected error during authentication: {str(e)}")
             return False
     
-    def send_record(self, record: Dict[str, Any]) -> Tuple[int, Any]:
+    def _log_auth_error(self, response: requests.Response) -> None:
+        """
+        Log why the OPS Portal API rejected an authentication request.
+        
+        Args:
+            response (requests.Response): Error response from the auth endpoint
+        """
+        status_code = response.status_code
+        response_data = _parse_body(response)
+        logger.error(f"Authentication failed: HTTP {status_code} from {self.auth_url}")
+        
+        # Check for service downtime indicators
+        if status_code >= 500:
+            logger.error(f"OPS Portal service appears to be down (HTTP {status_code})")
+            
+            # Check for specific ASP.NET Core startup errors
+            if 'ASP.NET Core app failed to start' in str(response_data):
+                logger.error("Service startup failure detected - ASP.NET Core app failed to start within timeout")
+                logger.warning("This is a server-side issue. The service may be undergoing maintenance or experiencing technical difficulties.")
+            elif 'Internal Server Error' in str(response_data):
+                logger.error("Internal server error detected - service may be temporarily unavailable")
+            else:
+                logger.error(f"Server error {status_code} - service may be experiencing issues")
+                
+        elif status_code == 404:
+            logger.error("Authentication endpoint not found - check if the auth_url is correct")
+        elif status_code == 403:
+            logger.error("Access forbidden - check client credentials or SSL certificate")
+        elif status_code == 401:
+            logger.error("Authentication failed - invalid client credentials")
+        else:
+            logger.error(f"HTTP {status_code} error during authentication")
+        
+        # Log response details for debugging
+        if isinstance(response_data, str):
+            # For HTML error pages (like the ASP.NET error), just log a snippet
+            if len(response_data) > 500:
+                logger.debug(f"Error response text (truncated): {response_data[:500]}...")
+            else:
+                logger.debug(f"Error response text: {response_data}")
+        else:
+            logger.debug(f"Error response JSON: {response_data}")
+    
+    def send_record(self, record: Dict[str, Any], record_id: Optional[str] = None) -> Tuple[int, Any]:
         """
         Send a single record to the OPS Portal API.
         
         Args:
             record (Dict[str, Any]): Record data to send
+            record_id (str, optional): ID used in log messages. Defaults to the record's
+                tenantItemID.
             
         Returns:
-            Tuple[int, Any]: Tuple containing (status_code, response_data)
+            Tuple[int, Any]: Tuple containing (status_code, response_data). The response
+                body is only decoded for failed submissions; it is None on success.
         """
-        record_id = record.get('tenantItemID', 'unknown')
+        if record_id is None:
+            record_id = record.get('tenantItemID', 'unknown')
+        # Bind the session's post method and the URL once; both are used again on retry
+        post = self.session.post
+        item_url = self.item_url
+        # Formatting the payload and response is costly for large records, so the
+        # debug messages are only built when they will be emitted
+        debug = logger.isEnabledFor(logging.DEBUG)
         
         try:
-            # Log x509 certificate usage for this API call
-            if self.session.cert:
-                logger.debug(f"Sending record {record_id} to OPS API using X.509 client certificate authentication")
-                logger.debug("X.509 certificate format: PEM-encoded, will be presented during TLS handshake")
-            
-            # Log the complete JSON payload for troubleshooting
-            logger.debug(f"Sending record {record_id} to OPS API with payload: {record}")
-            
-            response = self.session.post(
-                self.item_url,
-                json=record
-            )
+            if debug:
+                # Log x509 certificate usage for this API call
+                if self.client_cert_pem:
+                    logger.debug(f"Sending record {record_id} to OPS API using X.509 client certificate authentication")
+                    logger.debug("X.509 certificate format: PEM-encoded, will be presented during TLS handshake")
+                
+                # Log the complete JSON payload for troubleshooting
+                logger.debug(f"Sending record {record_id} to OPS API with payload: {record}")
             
+            token = self.token
+            body = _dumps(record)
+            response = post(item_url, data=body)
             status_code = response.status_code
             
-            # Log TLS version used for this request if available
-            if hasattr(response.raw, 'connection') and hasattr(response.raw.connection, 'socket'):
-                tls_version = response.raw.connection.socket.version()
-                logger.debug(f"TLS version used for API call: {tls_version}")
-            
-            # Handle different response types
-            try:
-                response_data = response.json()
-            except ValueError:
-                # Response is not JSON (e.g., HTML error page)
-                response_data = response.text
-            
-            # Log the complete response data for troubleshooting
-            logger.debug(f"Response for record {record_id}: {response_data}")
+            # The token may have expired since it was issued; refresh it once and retry
+            if status_code == 401 and self._refresh_token(token):
+                logger.info(f"Retrying record {record_id} with a refreshed token")
+                response = post(item_url, data=body)
+                status_code = response.status_code
             
             if 200 <= status_code < 300:
+                # Callers only look at the body of failed submissions, so don't decode it here
+                response_data = None
                 logger.info(f"Successfully sent record {record_id}")
             else:
+                response_data = _parse_body(response)
+                
+                # Log the complete response data for troubleshooting
+                if debug:
+                    logger.debug(f"Response for record {record_id}: {response_data}")
+                    logger.debug(f"TLS version used for API call: {_tls_version(response)}")
+                
                 # Log specific error details for failed submissions
                 if status_code >= 500:
                     logger.error(f"Server error {status_code} when sending record {record_id} - service may be down")
                     if 'ASP.NET Core app failed to start' in str(response_data):
                         logger.error(f"Service startup failure detected while sending record {record_id}")
-                elif status_code == 401:
-                    logger.error(f"Authentication failed when sending record {record_id} - token may have expired")
-                elif status_code == 403:
-                    logger.error(f"Access forbidden when sending record {record_id} - check permissions")
-                elif status_code == 404:
-                    logger.error(f"Item endpoint not found when sending record {record_id} - check item_url")
+                elif status_code in _RECORD_ERROR_MESSAGES:
+                    logger.error(_RECORD_ERROR_MESSAGES[status_code].format(record_id=record_id))
                 else:
                     logger.warning(
                         f"Failed to send record {record_id}: "
@@ -514,47 +847,205 @@ class OpsPortalClient:
             logger.error(f"Unexpected error sending record {record_id}: {str(e)}")
             return 0, str(e)
     
-    def send_records(self, records: List[Dict[str, Any]]) -> Dict[str, Tuple[int, Any]]:
+    def has_valid_token(self) -> bool:
+        """
+        Check whether the client holds a token that can still be used.
+        
+        Tokens without a known expiry are assumed valid until the API rejects them.
+        
+        Returns:
+            bool: True if a token is set and not within TOKEN_EXPIRY_MARGIN of expiring
+        """
+        if not self.token:
+            return False
+        return self.token_expiry is None or time.time() < self.token_expiry - TOKEN_EXPIRY_MARGIN
+    
+    def _refresh_token(self, stale_token: Any) -> bool:
+        """
+        Re-authenticate after a request was rejected with the given token.
+        
+        Only the first caller re-authenticates; callers that were rejected with the same
+        token while that was in progress reuse the new token.
+        
+        Args:
+            stale_token (Any): Token the rejected request was sent with
+            
+        Returns:
+            bool: True if a new token is available, False otherwise
+        """
+        with self._auth_lock:
+            if self.token is not None and self.token != stale_token:
+                return True
+            logger.info("Token rejected by OPS Portal API, re-authenticating")
+            return self.authenticate()
+    
+    def _warm_item_connection(self) -> None:
+        """
+        Open a pooled connection to the item endpoint ahead of the first record.
+        
+        A HEAD request completes the TCP and TLS handshakes and leaves the connection
+        in the session's pool. Failures are ignored; the first record will then open
+        the connection itself.
+        """
+        try:
+            self.session.head(self.item_url, timeout=10)
+        except requests.exceptions.RequestException as e:
+            logger.debug(f"Could not pre-open a connection to {self.item_url}: {str(e)}")
+    
+    def _send_authenticated_record(self, auth: Optional[Future], record: Dict[str, Any],
+                                   record_id: str) -> Tuple[int, Any]:
+        """
+        Send a single record once authentication has finished.
+        
+        Args:
+            auth (Future, optional): Pending authenticate() call, or None if already authenticated
+            record (Dict[str, Any]): Record data to send
+            record_id (str): ID the record's result is reported under
+            
+        Returns:
+            Tuple[int, Any]: Tuple containing (status_code, response_data)
+        """
+        if auth is not None and not auth.result():
+            return 0, "Authentication failed"
+        return self.send_record(record, record_id)
+    
+    def send_records(self, records: Iterable[Dict[str, Any]], first_index: int = 0) -> Dict[str, Tuple[int, Any]]:
         """
         Send multiple records to the OPS Portal API.
         
+        Records may be a list or any iterable, such as a generator producing rows
+        lazily; each record is submitted as soon as it is produced.
+        
         Args:
-            records (List[Dict[str, Any]]): List of record data to send
+            records (Iterable[Dict[str, Any]]): Record data to send
+            first_index (int): Position of the first record among all those being sent,
+                used to number records without a tenantItemID (default: 0)
             
         Returns:
             Dict[str, Tuple[int, Any]]: Dictionary mapping record IDs to (status_code, response_data) tuples
         """
-        if not self.token:
-            success = self.authenticate()
-            if not success:
-                logger.error("Cannot send records: Authentication failed")
-                return {record.get('tenantItemID', f'unknown_{i}'): (0, "Authentication failed") 
-                        for i, record in enumerate(records)}
+        logger.info("Sending records to OPS Portal API")
         
-        logger.info(f"Sending {len(records)} records to OPS Portal API")
+        # Send records concurrently over the session's connection pool. The executor
+        # only starts threads as work arrives, so short batches use fewer workers.
+        # Authentication runs on the pool too, so records are produced and queued
+        # while the token request is in flight. When items go to another host, the
+        # connection to it is opened at the same time.
+        # Each record's ID is looked up once, when it is submitted. Records without
+        # one get a distinct placeholder so their results aren't merged.
+        record_ids = []
+        futures = []
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            auth = None if self.has_valid_token() else executor.submit(self.authenticate)
+            if auth is not None and self._item_host_differs:
+                executor.submit(self._warm_item_connection)
+            for i, record in enumerate(records, first_index):
+                record_id = _record_id(record, i)
+                record_ids.append(record_id)
+                futures.append(executor.submit(self._send_authenticated_record, auth, record, record_id))
         
+        if auth is not None and not auth.result():
+            logger.error("Cannot send records: Authentication failed")
+            return dict.fromkeys(record_ids, (0, "Authentication failed"))
+        
+        responses = dict(zip(record_ids, (future.result() for future in futures)))
+        
+        # Log summary
+        success_count = sum(1 for status, _ in responses.values() if 200 <= status < 300)
+        logger.info(f"Successfully sent {success_count} of {len(responses)} records")
+        
+        return responses
+    
+    def send_records_batch(self, records: Iterable[Dict[str, Any]],
+                           chunk_size: int = DEFAULT_BATCH_SIZE) -> Dict[str, Tuple[int, Any]]:
+        """
+        Send records to the OPS Portal API as JSON arrays of up to chunk_size records.
+        
+        Arrays are posted to batch_url, or to item_url if no batch_url is configured.
+        If the endpoint rejects an array (BATCH_UNSUPPORTED_STATUS_CODES), that chunk
+        and all later ones are sent one record per request with send_records.
+        
+        Each record gets its own result from the matching item of the response
+        array (see _batch_item_results). If the response can't be split per record,
+        every record in the chunk gets the status of the whole response.
+        
+        Args:
+            records (Iterable[Dict[str, Any]]): Record data to send
+            chunk_size (int): Maximum number of records per request (default: DEFAULT_BATCH_SIZE)
+            
+        Returns:
+            Dict[str, Tuple[int, Any]]: Dictionary mapping record IDs to (status_code, response_data) tuples
+        """
+        logger.info(f"Sending records to OPS Portal API in batches of {chunk_size}")
+        
+        records = iter(records)
+        batch_url = self.batch_url or self.item_url
         responses = {}
-        for record in records:
-            record_id = record.get('tenantItemID', 'unknown')
-            status_code, response_data = self.send_record(record)
-            responses[record_id] = (status_code, response_data)
+        
+        if not self.has_valid_token() and not self.authenticate():
+            logger.error("Cannot send records: Authentication failed")
+            return {_record_id(record, i): (0, "Authentication failed")
+                    for i, record in enumerate(records)}
+        
+        first_index = 0
+        for chunk in iter(lambda: list(islice(records, chunk_size)), []):
+            start, first_index = first_index, first_index + len(chunk)
+            if not self._batch_supported:
+                responses.update(self.send_records(chunk, start))
+                continue
+            
+            try:
+                token = self.token
+                body = _dumps(chunk)
+                response = self.session.post(batch_url, data=body)
+                status_code = response.status_code
+                
+                if status_code == 401 and self._refresh_token(token):
+                    response = self.session.post(batch_url, data=body)
+                    status_code = response.status_code
+            except requests.exceptions.RequestException as e:
+                logger.error(f"Network error sending batch of {len(chunk)} records: {str(e)}")
+                results = [(0, str(e))] * len(chunk)
+            else:
+                if status_code in BATCH_UNSUPPORTED_STATUS_CODES:
+                    logger.info(f"Item endpoint rejected a batch with status {status_code}, sending records individually")
+                    self._batch_supported = False
+                    responses.update(self.send_records(chunk, start))
+                    continue
+                
+                body = _parse_body(response)
+                results = _batch_item_results(body, len(chunk), status_code)
+                if results is None:
+                    # No per-record results; the chunk's status applies to every record
+                    response_data = None if 200 <= status_code < 300 else body
+                    results = [(status_code, response_data)] * len(chunk)
+                
+                failed_count = sum(1 for item_status, _ in results if not 200 <= item_status < 300)
+                if failed_count:
+                    logger.error(f"Failed to send {failed_count} of {len(chunk)} records in batch: Status {status_code}, Response: {body}")
+                else:
+                    logger.info(f"Successfully sent batch of {len(chunk)} records")
+            
+            for i, (record, result) in enumerate(zip(chunk, results), start):
+                responses[_record_id(record, i)] = result
         
         # Log summary
         success_count = sum(1 for status, _ in responses.values() if 200 <= status < 300)
-        logger.info(f"Successfully sent {success_count} of {len(records)} records")
+        logger.info(f"Successfully sent {success_count} of {len(responses)} records")
         
         return responses
 
-
-def send(data: List[Dict[str, Any]], config: Optional[Dict[str, Any]] = None) -> Dict[str, Tuple[int, Any]]:
+def send(data: Iterable[Dict[str, Any]], config: Optional[Dict[str, Any]] = None) -> Dict[str, Tuple[int, Any]]:
     """
     Send data records to the OPS Portal API.
     
-    This is a convenience function that creates an OpsPortalClient and sends the records.
+    This is a convenience function that sends the records with an OpsPortalClient. The
+    client is created on the first call for a given configuration and reused afterwards,
+    so warm invocations keep the session, its connections and the bearer token.
     This function matches the interface of the reference example in 'OPS API Example/send.py'.
     
     Args:
-        data (List[Dict[str, Any]]): List of record data to send
+        data (Iterable[Dict[str, Any]]): Record data to send
         config (Dict[str, Any], optional): Configuration dictionary. If None, uses default values.
         
     Returns:
@@ -572,5 +1063,14 @@ def send(data: List[Dict[str, Any]], config: Optional[Dict[str, Any]] = None) ->
             'pfx_password': None  # Password for the PKCS#12 file
         }
     
-    client = OpsPortalClient(config)
+    # Certificate data may be bytes or nested dicts, so key on a digest of a serialized
+    # copy, which also keeps the secrets out of the cache keys
+    key = hashlib.sha256(json.dumps(config, sort_keys=True, default=repr).encode('utf-8')).hexdigest()
+    # Concurrent first calls must not each build (and authenticate) their own client
+    with _clients_lock:
+        client = _clients.get(key)
+        if client is None:
+            client = _clients[key] = OpsPortalClient(config)
+    if client.batch_size > 0 or client.batch_url:
+        return client.send_records_batch(data, client.batch_size or DEFAULT_BATCH_SIZE)
     return client.send_records(data)
@@ -2,12 +2,23 @@
 HTML Stripper Module
 
 This module provides functionality to strip HTML tags from text.
-It contains a custom HTMLParser subclass (MLStripper) and a utility function (strip_tags).
+It contains a custom HTMLParser subclass (MLStripper), a utility function (strip_tags)
+and a column-wise variant for pandas Series (strip_tags_series).
 """
 
+import threading
 from io import StringIO
 from html.parser import HTMLParser
 
+import pandas as pd
+
+# Text without these characters contains no tags or character references, so the
+# parser would return it unchanged
+_MARKUP_PATTERN = r'[<&]'
+
+# Per-thread parser reused by strip_tags
+_local = threading.local()
+
 
 class MLStripper(HTMLParser):
     """
@@ -25,6 +36,11 @@ class MLStripper(HTMLParser):
         self.convert_charrefs = True
         self.text = StringIO()
         
+    def reset(self):
+        """Reset the parser and clear the output buffer so the instance can be reused."""
+        super().reset()
+        self.text = StringIO()
+        
     def handle_data(self, d):
         """Handle text data by writing it to the output buffer."""
         self.text.write(d)
@@ -50,6 +66,41 @@ def strip_tags(html):
     """
     if not html:
         return ""
-    s = MLStripper()
+    if '<' not in html and '&' not in html:
+        # No tags or character references: the parser would return the text unchanged
+        return html
+    s = getattr(_local, 'stripper', None)
+    if s is None:
+        s = _local.stripper = MLStripper()
+    else:
+        s.reset()
     s.feed(html)
     return s.get_data()
+
+
+def strip_tags_series(values: pd.Series) -> pd.Series:
+    """
+    Strip HTML tags from every value in a Series.
+    
+    Equivalent to values.apply(strip_tags), but a vectorized check first picks out
+    the values that contain markup, and each distinct one of those is parsed once.
+    Exploded records repeat the same text on several rows, so this parses far
+    fewer values than there are rows. Missing values become empty strings.
+    
+    Args:
+        values (pd.Series): HTML text values
+        
+    Returns:
+        pd.Series: Text content without HTML tags, with the same index
+    """
+    if not pd.api.types.is_string_dtype(values):
+        # The .str accessor needs text values; keep the per-value behaviour otherwise
+        return values.apply(strip_tags)
+    
+    has_markup = values.str.contains(_MARKUP_PATTERN, regex=True, na=False)
+    result = values.fillna('')
+    if has_markup.any():
+        marked = values[has_markup]
+        stripped = {value: strip_tags(value) for value in marked.unique()}
+        result[has_markup] = marked.map(stripped)
+    return result
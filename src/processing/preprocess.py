@@ -7,8 +7,9 @@ from the USCIS Archer system before sending it to the DHS OPS Portal.
 
 import os
 import sys
+import logging
 from datetime import datetime
-from typing import Dict, List, Any, Optional
+from typing import Dict, Iterator, List, Any, Optional, Tuple
 from pathlib import Path
 
 import pandas as pd
@@ -16,13 +17,131 @@ import numpy as np
 
 from .field_mapping import field_names
 from .default_fields import default_fields
-from .html_stripper import strip_tags
+from .html_stripper import strip_tags_series
 from ..utils.logging_utils import get_logger
 from ..utils.time_utils import format_datetime_for_api
 
 # Get logger for this module
 logger = get_logger('processing.preprocess')
 
+# Columns the SIR data is matched to the category mappings on
+_MERGE_COLUMNS = ['Type_of_SIR', 'Category_Type', 'Sub_Category_Type']
+
+# OPS Portal columns taken from the category mappings
+_CATEGORY_COLUMNS = ['category', 'type', 'subtype', 'sharing']
+
+# Parsed category mappings by path: (file modification time in ns, file size, mappings)
+_category_map_cache: Dict[str, Tuple[int, int, pd.DataFrame]] = {}
+
+
+def _explode_product(df: pd.DataFrame, columns: List[str]) -> pd.DataFrame:
+    """
+    Explode several list-like columns into every combination of their values.
+    
+    Produces the same rows, in the same order, as calling df.explode on each column
+    in turn, but builds the result in one pass instead of one DataFrame per column.
+    As with explode, scalars are kept, empty list-likes become NaN and index labels
+    are repeated.
+    
+    Args:
+        df (pd.DataFrame): Data with list-like columns
+        columns (List[str]): Columns to explode, outermost first
+        
+    Returns:
+        pd.DataFrame: Exploded data
+    """
+    def as_list(value):
+        if pd.api.types.is_list_like(value):
+            return list(value) or [np.nan]
+        return [value]
+    
+    values = [[as_list(value) for value in df[col]] for col in columns]
+    lengths = np.array([[len(value) for value in col_values] for col_values in values],
+                       dtype=np.int64).reshape(len(columns), len(df))
+    row_counts = lengths.prod(axis=0)
+    
+    # Output row -> source row, and the position of each output row within its source
+    # row's combinations
+    rows = np.repeat(np.arange(len(df)), row_counts)
+    position = np.arange(len(rows)) - np.repeat(np.cumsum(row_counts) - row_counts, row_counts)
+    
+    result = df.iloc[rows].copy()
+    # Number of combinations each value of a column spans (later columns vary fastest)
+    span = np.ones(len(df), dtype=np.int64)
+    for i in range(len(columns) - 1, -1, -1):
+        flat = np.empty(lengths[i].sum(), dtype=object)
+        flat[:] = [item for value in values[i] for item in value]
+        offsets = np.cumsum(lengths[i]) - lengths[i]
+        index = offsets[rows] + (position // span[rows]) % lengths[i][rows]
+        result[columns[i]] = flat[index]
+        span = span * lengths[i]
+    return result
+
+
+def _clean_merge_column(values: pd.Series) -> pd.Series:
+    """
+    Convert a category merge column to strings, with missing values as ''.
+    
+    Missing values, and the 'nan'/'None' strings they would otherwise be cast to,
+    are masked before the cast so the column is converted in a single pass.
+    
+    Args:
+        values (pd.Series): Merge column
+        
+    Returns:
+        pd.Series: Column of strings
+    """
+    missing = values.isna() | values.isin(('nan', 'None'))
+    return values.where(~missing, '').astype(str)
+
+
+def _load_category_map(path: str) -> pd.DataFrame:
+    """
+    Load the category mappings, indexed by the merge columns.
+    
+    The result is cached per path and reused until the file's modification time or
+    size changes. It is shared between calls, so it must not be modified.
+    
+    Args:
+        path (str): Path to the category mapping CSV file
+        
+    Returns:
+        pd.DataFrame: Category mappings with a (Type_of_SIR, Category_Type,
+            Sub_Category_Type) MultiIndex
+    """
+    stat = os.stat(path)
+    cached = _category_map_cache.get(path)
+    if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+        return cached[2]
+    
+    # Only the merge and OPS category columns are used, and they are all text
+    wanted = set(_MERGE_COLUMNS + _CATEGORY_COLUMNS)
+    category_map = pd.read_csv(path, usecols=lambda col: col in wanted, dtype=str)
+    for col in _MERGE_COLUMNS:
+        category_map[col] = _clean_merge_column(category_map[col])
+    category_map = category_map.set_index(_MERGE_COLUMNS)
+    
+    _category_map_cache[path] = (stat.st_mtime_ns, stat.st_size, category_map)
+    return category_map
+
+
+def iter_records(df: pd.DataFrame) -> Iterator[Dict[str, Any]]:
+    """
+    Yield the rows of a DataFrame as record dictionaries, one at a time.
+    
+    Unlike df.to_dict('records'), this does not build the whole list up front, so
+    records can be sent while later rows are still being converted.
+    
+    Args:
+        df (pd.DataFrame): Processed data
+        
+    Yields:
+        Dict[str, Any]: Record keyed by column name
+    """
+    columns = list(df.columns)
+    for row in df.itertuples(index=False, name=None):
+        yield dict(zip(columns, row))
+
 
 def preprocess(data: List[Dict[str, Any]], last_run_time: datetime, config: Optional[Dict[str, Any]] = None) -> pd.DataFrame:
     """
@@ -66,20 +185,13 @@ def preprocess(data: List[Dict[str, Any]], last_run_time: datetime, config: Opti
             # Return empty DataFrame with expected column structure
             expected_columns = list(field_names.values()) + list(default_fields.keys())
             # Remove duplicates while preserving order
-            seen = set()
-            unique_columns = []
-            for col in expected_columns:
-                if col not in seen:
-                    unique_columns.append(col)
-                    seen.add(col)
+            unique_columns = list(dict.fromkeys(expected_columns))
             return pd.DataFrame(columns=unique_columns)
         
         logger.info(f"Processing {len(data)} records")
         
         # Read data into DataFrame
         try:
-            df = pd.DataFrame(data)
-            
             # Check if required columns exist
             required_columns = [
                 'Incident_ID', 'SIR_', 'Local_Date_Reported',
@@ -88,13 +200,15 @@ def preprocess(data: List[Dict[str, Any]], last_run_time: datetime, config: Opti
                 'Type_of_SIR', 'Category_Type', 'Sub_Category_Type'
             ]
             
-            missing_columns = [col for col in required_columns if col not in df.columns]
+            # A column exists if any record has the field (usually the first one does)
+            missing_columns = [col for col in required_columns if not any(col in record for record in data)]
             if missing_columns:
                 logger.error(f"Missing required columns: {missing_columns}")
                 raise ValueError(f"Missing required columns: {missing_columns}")
             
-            # Select required columns and set index
-            df = df[required_columns].set_index('Incident_ID')
+            # Build only the required columns rather than one for every field in the
+            # records, then set the index
+            df = pd.DataFrame.from_records(data, columns=required_columns).set_index('Incident_ID')
             
         except Exception as e:
             logger.error(f"Error creating DataFrame: {str(e)}")
@@ -102,15 +216,15 @@ def preprocess(data: List[Dict[str, Any]], last_run_time: datetime, config: Opti
         
         # Apply filters
         original_count = len(df)
-        filter_mask = pd.Series([True] * len(df), index=df.index)
+        filter_mask = np.ones(len(df), dtype=bool)
         
         if filter_rejected:
             logger.info("Applying filter: excluding rejected SIRs")
-            filter_mask = filter_mask & (df['SIR_'] != 'REJECTED')
+            filter_mask &= (df['SIR_'] != 'REJECTED').to_numpy()
             
         if filter_unprocessed:
             logger.info("Applying filter: excluding unprocessed SIRs")
-            filter_mask = filter_mask & (~df['Date_SIR_Processed__NT'].isnull())
+            filter_mask &= df['Date_SIR_Processed__NT'].notna().to_numpy()
             
         if filter_by_datetime:
             logger.info(f"Applying filter: excluding records with Date_Time_SIR_Processed <= {last_run_time}")
@@ -142,7 +256,7 @@ def preprocess(data: List[Dict[str, Any]], last_run_time: datetime, config: Opti
                 # Apply the filters if we have a valid datetime series
                 if datetime_series is not None:
                     # Apply both filters: datetime > last_run_time AND submission_status = 'Assigned for Further Action'
-                    filter_mask = filter_mask & (datetime_series > last_run_time) & submission_status_filter
+                    filter_mask &= ((datetime_series > last_run_time) & submission_status_filter).to_numpy()
             except Exception as e:
                 logger.warning(f"Error applying datetime filter: {str(e)}")
                 logger.warning("Skipping datetime filtering due to error")
@@ -163,8 +277,7 @@ def preprocess(data: List[Dict[str, Any]], last_run_time: datetime, config: Opti
         # Log before exploding to track original record count
         logger.info(f"Before exploding columns, record count: {len(df)}")
         
-        for col in cols_to_explode:
-            df = df.explode(col)
+        df = _explode_product(df, cols_to_explode)
             
         # Log after exploding to see if record count changed
         logger.info(f"After exploding columns, record count: {len(df)}")
@@ -177,49 +290,33 @@ def preprocess(data: List[Dict[str, Any]], last_run_time: datetime, config: Opti
                 raise FileNotFoundError(f"Category mapping file not found: {category_mapping_file}")
             
             logger.info(f"Loading category mappings from {category_mapping_file}")
-            category_map = pd.read_csv(category_mapping_file)
-            
-            # Ensure consistent data types for merge columns
-            merge_columns = ['Type_of_SIR', 'Category_Type', 'Sub_Category_Type']
+            category_map = _load_category_map(category_mapping_file)
             
             # Convert merge columns to string type and handle NaN/None values
-            for col in merge_columns:
-                # For the main dataframe
-                df[col] = df[col].astype(str).replace('nan', '').replace('None', '')
-                # For the category mapping dataframe
-                category_map[col] = category_map[col].astype(str).replace('nan', '').replace('None', '')
-            
-            logger.debug(f"Data types before merge - df: {df[merge_columns].dtypes.to_dict()}")
-            logger.debug(f"Data types before merge - category_map: {category_map[merge_columns].dtypes.to_dict()}")
-            
-            # Create a temporary column with the original incident ID
-            df['original_incident_id'] = df.index
+            for col in _MERGE_COLUMNS:
+                df[col] = _clean_merge_column(df[col])
             
-            # Reset index to make Incident_ID a regular column
-            df_reset = df.reset_index()
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Data types before merge - df: %s", df[_MERGE_COLUMNS].dtypes.to_dict())
+                logger.debug("Data types before merge - category_map: %s", category_map.index.dtypes.to_dict())
             
-            # Merge with category mappings
+            # Look up each record's category mapping on the pre-indexed mappings; the
+            # join keeps the Incident_ID index
             original_count = len(df)
-            df = pd.merge(
-                df_reset,
+            df = df.join(
                 category_map,
-                on=merge_columns,
-                how='left'  # Changed from 'inner' to 'left' to preserve all records
+                on=_MERGE_COLUMNS,
+                how='left'  # Left join to preserve all records
             )
             merged_count = len(df)
             
-            # Ensure Incident_ID exists after merge
-            if 'Incident_ID' not in df.columns and 'original_incident_id' in df.columns:
-                logger.info("Restoring 'Incident_ID' from 'original_incident_id' after merge")
-                df['Incident_ID'] = df['original_incident_id']
-            
             # Handle records that didn't match any category mapping
-            category_columns = ['category', 'type', 'subtype', 'sharing']
+            category_columns = _CATEGORY_COLUMNS
             for col in category_columns:
                 if col in df.columns:
                     null_count = df[col].isnull().sum()
                     if null_count > 0:
-                        logger.warning(f"Found {null_count} records with no mapping for '{col}'. Applying default values.")
+                        logger.warning("Found %s records with no mapping for '%s'. Applying default values.", null_count, col)
                         # Apply default values for unmapped records
                         if col == 'category':
                             df[col] = df[col].fillna('Incident')
@@ -235,42 +332,20 @@ def preprocess(data: List[Dict[str, Any]], last_run_time: datetime, config: Opti
                 logger.warning(f"Merge changed row count from {original_count} to {merged_count}")
                 
                 # If we have duplicates due to the merge, we need to handle them
-                if merged_count > original_count and 'Incident_ID' in df.columns:
+                if merged_count > original_count:
                     logger.warning("Merge created duplicate rows. Keeping only the first occurrence of each incident ID.")
-                    try:
-                        # Keep only the first occurrence of each incident ID
-                        df = df.drop_duplicates(subset=['Incident_ID'])
-                        logger.info(f"After removing duplicates: {len(df)} rows")
-                    except KeyError as e:
-                        logger.error(f"Error dropping duplicates: {str(e)}")
-                        logger.error(f"Available columns: {df.columns.tolist()}")
-            
-            # Ensure we have the original incident IDs
-            if 'Incident_ID' in df.columns:
-                logger.info("Found 'Incident_ID' column after merge")
-                # Set the index back to Incident_ID
-                df = df.set_index('Incident_ID')
-                logger.info("Reset index to Incident_ID after merge")
-            else:
-                logger.warning("'Incident_ID' column not found after merge")
-                logger.warning(f"Available columns: {df.columns.tolist()}")
+                    # Keep only the first occurrence of each incident ID
+                    df = df[~df.index.duplicated()]
+                    logger.info(f"After removing duplicates: {len(df)} rows")
             
             # With a left join, no records should be dropped, but we might have unmapped records
             unmapped_records = sum(df[category_columns].isnull().any(axis=1))
             logger.info(f"Category mapping: {merged_count} total records, {unmapped_records} records with default category values")
             
             # Log each record's Incident ID after category mapping
-            if 'Incident_ID' in df.columns:
-                for _, row in df.iterrows():
-                    incident_id = row['Incident_ID']
-                    sir_id = row.get('SIR_', 'N/A')
-                    sir_type = row.get('Type_of_SIR', 'N/A')
-                    logger.info(f"Processing record - Incident ID: {incident_id}, SIR ID: {sir_id}, Type: {sir_type}")
-            elif df.index.name == 'Incident_ID':
-                for incident_id, row in df.iterrows():
-                    sir_id = row.get('SIR_', 'N/A')
-                    sir_type = row.get('Type_of_SIR', 'N/A')
-                    logger.info(f"Processing record - Incident ID: {incident_id}, SIR ID: {sir_id}, Type: {sir_type}")
+            if logger.isEnabledFor(logging.INFO):
+                for incident_id, sir_id, sir_type in zip(df.index, df['SIR_'], df['Type_of_SIR']):
+                    logger.info("Processing record - Incident ID: %s, SIR ID: %s, Type: %s", incident_id, sir_id, sir_type)
             
         except Exception as e:
             logger.error(f"Error mapping categories: {str(e)}")
@@ -280,34 +355,32 @@ def preprocess(data: List[Dict[str, Any]], last_run_time: datetime, config: Opti
         cols_to_strip = ['Details', 'Section_5__Action_Taken']
         
         for col in cols_to_strip:
-            logger.debug(f"Stripping HTML tags from {col}")
-            df[col] = df[col].apply(strip_tags)
+            logger.debug("Stripping HTML tags from %s", col)
+            df[col] = strip_tags_series(df[col])
         
         # Add derived columns
         logger.info("Adding derived columns")
-        df['title'] = '[' + df['SIR_'] + ']: ' + df['Type_of_SIR']
-        df['incidentReportDetails'] = df['Details'] + '\n' + df['Section_5__Action_Taken']
+        # str.cat joins each pair with the separator in one pass instead of one per '+'
+        df['title'] = '[' + df['SIR_'].str.cat(df['Type_of_SIR'], sep=']: ')
+        df['incidentReportDetails'] = df['Details'].str.cat(df['Section_5__Action_Taken'], sep='\n')
         
-        # Add default fields
+        # Add default fields, all in one step rather than one column insert per field
         logger.info("Adding default fields")
-        for key, value in default_fields.items():
-            df[key] = value
+        df = df.assign(**default_fields)
         
         # Format datetime columns using the time_utils function
         cols_to_format = ['Local_Date_Reported', 'Date_SIR_Processed__NT']
 
         for col in cols_to_format:
-            logger.debug(f"Formatting datetime column: {col}")
+            logger.debug("Formatting datetime column: %s", col)
             # Convert to datetime and format using our utility function
             # Parse ISO 8601 strings preserving original timezone info
             dt_series = pd.to_datetime(df[col])  # Removed utc=True to preserve original timezone
             
             # Log the original and parsed values for debugging
             if not df[col].empty:
-                sample_original = df[col].iloc[0]
-                sample_parsed = dt_series.iloc[0]
-                logger.debug(f"Sample {col} original value: {sample_original}")
-                logger.debug(f"Sample {col} parsed value: {sample_parsed}")
+                logger.debug("Sample %s original value: %s", col, df[col].iloc[0])
+                logger.debug("Sample %s parsed value: %s", col, dt_series.iloc[0])
             
             df[col] = format_datetime_for_api(dt_series, col)
         
@@ -316,7 +389,7 @@ def preprocess(data: List[Dict[str, Any]], last_run_time: datetime, config: Opti
         
         for field in default_datetime_fields:
             if field in df.columns and df[field].notna().any():
-                logger.debug(f"Formatting default datetime field: {field}")
+                logger.debug("Formatting default datetime field: %s", field)
                 # Convert to datetime and format using our utility function
                 dt_series = pd.to_datetime(df[field])
                 df[field] = format_datetime_for_api(dt_series, field)
@@ -325,60 +398,21 @@ def preprocess(data: List[Dict[str, Any]], last_run_time: datetime, config: Opti
         cols_to_convert = ['Facility_Latitude', 'Facility_Longitude']
         
         for col in cols_to_convert:
-            logger.debug(f"Converting {col} to string")
+            logger.debug("Converting %s to string", col)
             df[col] = df[col].astype(str)
         
-        # Store the current index name before resetting
-        current_index_name = df.index.name
-        logger.info(f"Current index name before reset: {current_index_name}")
-        
-        # Ensure the index has a name before resetting it
-        if current_index_name is None:
-            logger.info("Index has no name, setting it to 'Incident_ID'")
-            df.index.name = 'Incident_ID'
-            current_index_name = 'Incident_ID'
-        
-        # Reset index to make the index a regular column
+        # Make the Incident_ID index a regular column
         df = df.reset_index()
         
-        # After reset_index(), the index becomes a column with the name that was stored in index.name
-        logger.info(f"Available columns after reset: {df.columns.tolist()}")
-        
-        # Check if we have the Incident_ID column after resetting
-        if 'Incident_ID' in df.columns:
-            logger.info("Incident_ID column found after resetting index")
-        elif current_index_name in df.columns:
-            # If the index column was created with a different name, rename it
-            logger.info(f"Found index column with name: {current_index_name}, renaming to Incident_ID")
-            df['Incident_ID'] = df[current_index_name]
-        else:
-            # If we still don't have an Incident_ID column, log an error and create one from the index
-            logger.error("Incident_ID column not found after resetting index!")
-            logger.error(f"Available columns: {df.columns.tolist()}")
-            logger.warning("Creating Incident_ID column from current index")
-            df['Incident_ID'] = df.index
-        
         # Rename columns according to field mapping
         logger.info("Renaming columns according to field mapping")
-        df = df.rename(columns=field_names).replace({np.nan: None})
+        df = df.rename(columns=field_names)
         
-        # Ensure Incident_ID column exists and is preserved
-        if 'Incident_ID' not in df.columns:
-            logger.warning("Incident_ID column not found after renaming. Creating it explicitly.")
-            
-            # Try to create it from original_incident_id first (most accurate)
-            if 'original_incident_id' in df.columns:
-                df['Incident_ID'] = df['original_incident_id']
-                logger.info("Created Incident_ID column from original_incident_id")
-            # Otherwise try from Incident_ID
-            elif 'Incident_ID' in df.columns:
-                # This is redundant but keeping for clarity
-                df['Incident_ID'] = df['Incident_ID']
-                logger.info("Incident_ID column already exists")
-            # Last resort, use index
-            else:
-                logger.warning("No source column found for Incident_ID, using current index")
-                df['Incident_ID'] = df.index
+        # Send missing values as None, converting only the columns that have any
+        missing = df.isna()
+        na_columns = df.columns[missing.any()]
+        if len(na_columns):
+            df[na_columns] = df[na_columns].astype(object).where(~missing[na_columns], None)
         
         # Log the columns to verify Incident_ID is present
         logger.info(f"Columns after renaming: {df.columns.tolist()}")
@@ -390,11 +424,6 @@ def preprocess(data: List[Dict[str, Any]], last_run_time: datetime, config: Opti
             # Removed 'Incident_ID' from columns to drop to preserve it for SSM parameter update
         ]
         
-        # Also drop temporary columns used for tracking incident IDs
-        if 'original_incident_id' in df.columns and 'Incident_ID' in df.columns:
-            cols_to_drop.append('original_incident_id')
-            logger.info("Adding original_incident_id to columns to drop since Incident_ID exists")
-        
         # Only drop columns that actually exist in the dataframe
         cols_to_drop = [col for col in cols_to_drop if col in df.columns]
         
@@ -402,20 +431,14 @@ def preprocess(data: List[Dict[str, Any]], last_run_time: datetime, config: Opti
         if cols_to_drop:
             df = df.drop(cols_to_drop, axis=1)
         
-        # Final verification that Incident_ID exists
-        if 'Incident_ID' not in df.columns:
-            logger.error("Incident_ID column is missing after all processing steps!")
-            logger.error(f"Available columns: {df.columns.tolist()}")
-            
-            # As a last resort, create the Incident_ID column from the index
-            # This is a fallback mechanism to ensure the column exists
-            logger.warning("Creating Incident_ID column as a last resort")
-            df['Incident_ID'] = df.index
-            logger.info(f"Created Incident_ID column from index. New columns: {df.columns.tolist()}")
-        
-        # Log the final list of Incident IDs that are ready for submission
-        if 'Incident_ID' in df.columns:
-            logger.info(f"Final Incident IDs ready for submission: {df['Incident_ID'].tolist()}")
+        # Log the final list of Incident IDs that are ready for submission, and record the
+        # highest one from the same list so callers don't have to scan the column again
+        incident_ids = df['Incident_ID'].tolist()
+        logger.info(f"Final Incident IDs ready for submission: {incident_ids}")
+        df.attrs['max_incident_id'] = max(
+            (incident_id for incident_id in incident_ids if incident_id is not None),
+            default=None
+        )
         
         # Post-processing step to ensure openDate is properly set and add the required item field
         logger.info("Post-processing: Ensuring openDate is properly set and adding required item field")
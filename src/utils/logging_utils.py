@@ -7,6 +7,7 @@ This module provides utilities for setting up and managing logging throughout th
 import os
 import logging
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Any, Optional
 
@@ -121,10 +122,14 @@ def setup_logging(log_level=None, log_file=None, log_format=None, config=None):
     return logger
 
 
+@lru_cache(maxsize=None)
 def get_logger(name=None):
     """
     Get a logger instance.
     
+    Loggers are cached by name, so repeated calls return the same instance without
+    looking it up again.
+    
     Args:
         name (str, optional): Name of the logger. If None, returns the root logger.
         
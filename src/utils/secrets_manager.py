@@ -45,15 +45,15 @@ class SecretsManager:
                 region_name=self.region_name,
                 endpoint_url=endpoint_url
             )
-            logger.info(f"Initialized Secrets Manager client for region: {self.region_name} with endpoint URL: {endpoint_url}")
+            logger.info("Initialized Secrets Manager client for region: %s with endpoint URL: %s", self.region_name, endpoint_url)
         else:
             self.client = session.client(
                 service_name='secretsmanager',
                 region_name=self.region_name
             )
-            logger.info(f"Initialized Secrets Manager client for region: {self.region_name}")
+            logger.info("Initialized Secrets Manager client for region: %s", self.region_name)
         
-        logger.info(f"Initialized Secrets Manager client for region: {self.region_name}")
+        logger.info("Initialized Secrets Manager client for region: %s", self.region_name)
     
     def get_secret(self, secret_name: str) -> Dict[str, Any]:
         """
@@ -70,7 +70,7 @@ class SecretsManager:
             json.JSONDecodeError: If the secret is not valid JSON
         """
         try:
-            logger.info(f"Retrieving secret: {secret_name}")
+            logger.info("Retrieving secret: %s", secret_name)
             
             get_secret_value_response = self.client.get_secret_value(
                 SecretId=secret_name
@@ -78,7 +78,7 @@ class SecretsManager:
             
             # Parse the secret string as JSON
             secret_string = get_secret_value_response['SecretString']
-            logger.debug(f"Raw secret string length: {len(secret_string)}")
+            logger.debug("Raw secret string length: %d", len(secret_string))
             
             try:
                 secret_data = json.loads(secret_string)
@@ -89,17 +89,17 @@ class SecretsManager:
                 end_pos = min(len(secret_string), error_pos + 50)
                 context = secret_string[start_pos:end_pos]
                 
-                logger.error(f"JSON parsing error at position {error_pos}")
-                logger.error(f"Context around error: ...{context}...")
-                logger.error(f"Full JSON error: {str(json_error)}")
+                logger.error("JSON parsing error at position %s", error_pos)
+                logger.error("Context around error: ...%s...", context)
+                logger.error("Full JSON error: %s", json_error)
                 raise json_error
             
-            logger.info(f"Successfully retrieved secret: {secret_name}")
+            logger.info("Successfully retrieved secret: %s", secret_name)
             return secret_data
             
         except ClientError as e:
             error_code = e.response['Error']['Code']
-            logger.error(f"Error retrieving secret {secret_name}: {error_code} - {str(e)}")
+            logger.error("Error retrieving secret %s: %s - %s", secret_name, error_code, e)
             
             # Handle specific error cases
             if error_code == 'DecryptionFailureException':
@@ -121,10 +121,10 @@ class SecretsManager:
                 raise e
                 
         except json.JSONDecodeError as e:
-            logger.error(f"Error parsing secret {secret_name} as JSON: {str(e)}")
+            logger.error("Error parsing secret %s as JSON: %s", secret_name, e)
             raise e
         except Exception as e:
-            logger.error(f"Unexpected error retrieving secret {secret_name}: {str(e)}")
+            logger.error("Unexpected error retrieving secret %s: %s", secret_name, e)
             raise e
     
     def get_secret_value(self, secret_name: str, key: str, default: Any = None) -> Any:
@@ -143,7 +143,7 @@ class SecretsManager:
             secret_data = self.get_secret(secret_name)
             return secret_data.get(key, default)
         except Exception as e:
-            logger.warning(f"Error getting secret value {key} from {secret_name}: {str(e)}")
+            logger.warning("Error getting secret value %s from %s: %s", key, secret_name, e)
             return default
 
 
@@ -274,5 +274,5 @@ def load_config_from_secrets() -> Dict[str, Any]:
         return config
         
     except Exception as e:
-        logger.error(f"Error loading configuration from secrets: {str(e)}")
+        logger.error("Error loading configuration from secrets: %s", e)
         raise
@@ -0,0 +1,27 @@
+"""
+SSM Client Utility Module
+
+This module provides the shared AWS Systems Manager client used to read and write
+the parameters that track processing progress.
+"""
+
+from functools import lru_cache
+from typing import Optional
+
+
+@lru_cache(maxsize=4)
+def get_ssm_client(endpoint_url: Optional[str] = None):
+    """
+    Get an SSM client, creating it on first use and reusing it afterwards.
+    
+    Args:
+        endpoint_url (str, optional): Custom endpoint URL (e.g. LocalStack when running locally)
+        
+    Returns:
+        botocore.client.SSM: SSM client
+    """
+    # Imported here so runs that never reach SSM don't pay for loading botocore. Only
+    # plain get/put parameter calls are made, so a low-level botocore client is enough
+    # and the boto3 session layer is skipped.
+    import botocore.session
+    return botocore.session.get_session().create_client('ssm', endpoint_url=endpoint_url)
@@ -6,12 +6,21 @@ particularly for logging the last run time of the script.
 """
 
 import os
-import pytz
 import boto3
+import numpy as np
 import pandas as pd
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Optional, Union
+from zoneinfo import ZoneInfo
+
+from .logging_utils import get_logger
+
+# Get logger for this module
+logger = get_logger('time_utils')
+
+# Timezone the run times are recorded in
+_EASTERN = ZoneInfo('US/Eastern')
 
 
 def log_time(log_file_path=None) -> datetime:
@@ -42,12 +51,11 @@ def log_time(log_file_path=None) -> datetime:
     if log_dir and not os.path.exists(log_dir):
         os.makedirs(log_dir)
     
-    # Set timezone and datetime format
-    tz = pytz.timezone('US/Eastern')
+    # Set datetime format
     fmt = '%Y-%m-%dT%H:%M:%S%z'
     
     # Get current time
-    current_time = datetime.now(pytz.UTC).astimezone(tz)
+    current_time = datetime.now(_EASTERN)
     
     try:
         # Read previous time and update the log file
@@ -75,8 +83,8 @@ def get_current_time(timezone_str='US/Eastern') -> datetime:
     Returns:
         datetime: Current time as a datetime object with timezone information
     """
-    tz = pytz.timezone(timezone_str)
-    return datetime.now(pytz.UTC).astimezone(tz)
+    tz = _EASTERN if timezone_str == 'US/Eastern' else ZoneInfo(timezone_str)
+    return datetime.now(tz)
 
 
 def format_datetime(dt, fmt='%Y-%m-%dT%H:%M:%S%z') -> str:
@@ -111,12 +119,11 @@ def get_last_run_time(log_file_path=None) -> datetime:
     if log_file_path is None:
         log_file_path = 'time_log.txt'
     
-    # Set timezone and datetime format
-    tz = pytz.timezone('US/Eastern')
+    # Set datetime format
     fmt = '%Y-%m-%dT%H:%M:%S%z'
     
     # Get current time as fallback
-    current_time = datetime.now(pytz.UTC).astimezone(tz)
+    current_time = datetime.now(_EASTERN)
     
     try:
         # Read previous time from the log file
@@ -149,15 +156,14 @@ def update_last_run_time(log_file_path=None, timestamp=None) -> None:
     if log_dir and not os.path.exists(log_dir):
         os.makedirs(log_dir)
     
-    # Set timezone and datetime format
-    tz = pytz.timezone('US/Eastern')
+    # Set datetime format
     fmt = '%Y-%m-%dT%H:%M:%S%z'
     
     # Get current time if timestamp not provided
     if timestamp is None:
-        timestamp = datetime.now(pytz.UTC).astimezone(tz)
+        timestamp = datetime.now(_EASTERN)
     elif timestamp.tzinfo is None:
-        timestamp = tz.localize(timestamp)
+        timestamp = timestamp.replace(tzinfo=_EASTERN)
     
     # Update the log file
     with open(log_file_path, 'w') as file:
@@ -176,10 +182,6 @@ def get_last_run_time_from_ssm() -> datetime:
                  or current time if parameter doesn't exist or there's an error
     """
     try:
-        # Import logger here to avoid circular imports
-        from ..utils.logging_utils import get_logger
-        logger = get_logger('time_utils')
-        
         # Get endpoint URL from environment variable if running locally
         endpoint_url = os.environ.get('AWS_ENDPOINT_URL')
         
@@ -198,21 +200,17 @@ def get_last_run_time_from_ssm() -> datetime:
             # Parse the datetime with timezone information
             last_time = datetime.fromisoformat(time_str)
             
-            logger.info(f"Retrieved last run time from SSM: {last_time}")
+            logger.info("Retrieved last run time from SSM: %s", last_time)
             return last_time
             
         except ssm.exceptions.ParameterNotFound:
             # Parameter doesn't exist yet, this is normal for first run
             current_time = get_current_time()
-            logger.info(f"No previous run time found in SSM. Using current US/Eastern time: {current_time}")
+            logger.info("No previous run time found in SSM. Using current US/Eastern time: %s", current_time)
             return current_time
             
     except Exception as e:
-        # Import logger here to avoid circular imports
-        from ..utils.logging_utils import get_logger
-        logger = get_logger('time_utils')
-        
-        logger.warning(f"Error getting last run time from SSM: {str(e)}. Using current time.")
+        logger.warning("Error getting last run time from SSM: %s. Using current time.", e)
         return get_current_time()
 
 
@@ -227,16 +225,11 @@ def update_last_run_time_in_ssm(timestamp: Optional[datetime] = None) -> None:
         timestamp (datetime, optional): Timestamp to save. If None, uses current time.
     """
     try:
-        # Import logger here to avoid circular imports
-        from ..utils.logging_utils import get_logger
-        logger = get_logger('time_utils')
-        
         if timestamp is None:
             timestamp = get_current_time()
         elif timestamp.tzinfo is None:
             # Ensure timestamp has timezone information
-            eastern_tz = pytz.timezone('US/Eastern')
-            timestamp = eastern_tz.localize(timestamp)
+            timestamp = timestamp.replace(tzinfo=_EASTERN)
         
         # Format the timestamp as ISO 8601 string
         time_str = timestamp.isoformat()
@@ -260,14 +253,10 @@ def update_last_run_time_in_ssm(timestamp: Optional[datetime] = None) -> None:
             Description='Last run time for OPS API Lambda function in US/Eastern timezone'
         )
         
-        logger.info(f"Updated last run time in SSM: {time_str}")
+        logger.info("Updated last run time in SSM: %s", time_str)
         
     except Exception as e:
-        # Import logger here to avoid circular imports
-        from ..utils.logging_utils import get_logger
-        logger = get_logger('time_utils')
-        
-        logger.error(f"Error updating last run time in SSM: {str(e)}")
+        logger.error("Error updating last run time in SSM: %s", e)
         raise
 
 
@@ -303,6 +292,16 @@ def format_datetime_for_api(dt_series: Union[pd.Series, datetime], field_name: s
     
     # Handle pandas Series
     elif isinstance(dt_series, pd.Series):
+        if pd.api.types.is_datetime64_any_dtype(dt_series):
+            # Datetime columns are formatted in one vectorized pass. Dropping the timezone
+            # keeps the original wall-clock time, as for single values.
+            if dt_series.dt.tz is not None:
+                dt_series = dt_series.dt.tz_localize(None)
+            formatted = np.datetime_as_string(dt_series.to_numpy(dtype='datetime64[ms]'), unit='ms')
+            result = pd.Series(np.char.add(formatted, 'Z'), index=dt_series.index, dtype=object)
+            result[dt_series.isna()] = None
+            return result
+        
         def convert_datetime(dt):
             if pd.isna(dt):
                 return None
@@ -0,0 +1,131 @@
+"""
+Unit tests for the get_sir_data response cache in the archer.auth module.
+"""
+
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import src.archer.auth as archer_auth
+from src.archer.auth import ArcherAuth
+
+
+@unittest.skipUnless(hasattr(ArcherAuth, 'invalidate_cache'), "uscis-opts package not installed")
+class TestArcherSirDataCache(unittest.TestCase):
+    """Test cases for caching get_sir_data results."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        archer_auth._sir_data_cache.clear()
+        self.records = [
+            {'Incident_ID': 101, 'Submission_Status_1': 'Assigned for Further Action'},
+            {'Incident_ID': 102, 'Submission_Status_1': 'Assigned for Further Action'},
+        ]
+
+    def tearDown(self):
+        archer_auth._sir_data_cache.clear()
+
+    def _make_auth(self, cache_ttl):
+        auth = ArcherAuth('test_instance', 'test_user', 'test_pass', 'https://test.example.com',
+                          cache_ttl=cache_ttl)
+        auth.authenticated = True
+        return auth
+
+    def _patch_fetch(self, auth):
+        patch.object(auth, '_create_archer_client', return_value=object()).start()
+        patch.object(auth, '_find_sir_level_alias', return_value='Incidents').start()
+        fetch = patch.object(auth, '_fetch_sir_records', return_value=self.records).start()
+        self.addCleanup(patch.stopall)
+        return fetch
+
+    def test_cache_hit_skips_fetch(self):
+        """A second call with the same arguments is served from the cache."""
+        auth = self._make_auth(cache_ttl=300)
+        fetch = self._patch_fetch(auth)
+
+        first = auth.get_sir_data(since_incident_id=100)
+        second = auth.get_sir_data(since_incident_id=100)
+
+        self.assertEqual(first, second)
+        self.assertEqual(len(second), 2)
+        self.assertEqual(fetch.call_count, 1)
+
+    def test_different_arguments_miss_cache(self):
+        """Different filter arguments are cached separately."""
+        auth = self._make_auth(cache_ttl=300)
+        fetch = self._patch_fetch(auth)
+
+        auth.get_sir_data(since_incident_id=100)
+        filtered = auth.get_sir_data(since_incident_id=101)
+
+        self.assertEqual([r['Incident_ID'] for r in filtered], [102])
+        self.assertEqual(fetch.call_count, 2)
+
+    def test_cache_disabled_by_default(self):
+        """Without a cache_ttl every call fetches from Archer."""
+        auth = self._make_auth(cache_ttl=0)
+        fetch = self._patch_fetch(auth)
+
+        auth.get_sir_data()
+        auth.get_sir_data()
+
+        self.assertEqual(fetch.call_count, 2)
+        self.assertEqual(archer_auth._sir_data_cache, {})
+
+    def test_invalidate_cache(self):
+        """invalidate_cache drops the cached results for the instance."""
+        auth = self._make_auth(cache_ttl=300)
+        fetch = self._patch_fetch(auth)
+
+        auth.get_sir_data()
+        auth.invalidate_cache()
+        auth.get_sir_data()
+
+        self.assertEqual(fetch.call_count, 2)
+
+    def test_expired_entries_pruned_on_write(self):
+        """Caching a new result drops entries that have already expired."""
+        auth = self._make_auth(cache_ttl=300)
+        self._patch_fetch(auth)
+        stale_key = (auth.base_url, auth.ins, 1, None)
+        archer_auth._sir_data_cache[stale_key] = (0.0, [])
+
+        auth.get_sir_data(since_incident_id=100)
+
+        self.assertNotIn(stale_key, archer_auth._sir_data_cache)
+        self.assertEqual(len(archer_auth._sir_data_cache), 1)
+
+    def test_cache_bounded_per_instance(self):
+        """Each instance keeps at most _SIR_CACHE_MAX_ENTRIES results, evicting the least recently used."""
+        auth = self._make_auth(cache_ttl=300)
+        fetch = self._patch_fetch(auth)
+        limit = archer_auth._SIR_CACHE_MAX_ENTRIES
+
+        for incident_id in range(limit):
+            auth.get_sir_data(since_incident_id=incident_id)
+        auth.get_sir_data(since_incident_id=0)
+        auth.get_sir_data(since_incident_id=limit)
+
+        self.assertEqual(len(archer_auth._sir_data_cache), limit)
+        self.assertIn((auth.base_url, auth.ins, 0, None), archer_auth._sir_data_cache)
+        self.assertNotIn((auth.base_url, auth.ins, 1, None), archer_auth._sir_data_cache)
+        self.assertEqual(fetch.call_count, limit + 1)
+
+    def test_cache_shared_between_threads(self):
+        """Concurrent hits, writes and evictions neither raise nor exceed the bound."""
+        auth = self._make_auth(cache_ttl=300)
+        self._patch_fetch(auth)
+        limit = archer_auth._SIR_CACHE_MAX_ENTRIES
+
+        def fetch(i):
+            return auth.get_sir_data(since_incident_id=i % (2 * limit))
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(fetch, range(2000)))
+
+        self.assertTrue(all(result for result in results))
+        self.assertLessEqual(len(archer_auth._sir_data_cache), limit)
+
+
+if __name__ == '__main__':
+    unittest.main()
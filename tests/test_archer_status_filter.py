@@ -0,0 +1,44 @@
+"""
+Unit tests for the Submission_Status_1 filter in the archer.auth module.
+"""
+
+import unittest
+
+from src.archer.auth import ArcherAuth
+
+
+class _Status(str):
+    """str subclass, as returned by some JSON decoders."""
+
+
+@unittest.skipUnless(hasattr(ArcherAuth, '_has_target_submission_status'), "uscis-opts package not installed")
+class TestArcherStatusFilter(unittest.TestCase):
+    """Test cases for filtering SIR records by Submission_Status_1."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.auth = ArcherAuth('test_instance', 'test_user', 'test_pass', 'https://test.example.com')
+        self.target = 'Assigned for Further Action'
+
+    def test_filter_records_by_status(self):
+        """Only records with the target status, as a string or in a list, are kept."""
+        records = [
+            {'Incident_ID': 1, 'Submission_Status_1': self.target},
+            {'Incident_ID': 2, 'Submission_Status_1': 'Not Assigned'},
+            {'Incident_ID': 3, 'Submission_Status_1': ['Other', self.target]},
+            {'Incident_ID': 4},
+            {'Incident_ID': 5, 'Submission_Status_1': _Status(self.target)},
+        ]
+
+        filtered = self.auth._filter_records_by_status(records)
+
+        self.assertEqual([r['Incident_ID'] for r in filtered], [1, 3, 5])
+
+    def test_str_subclass_status_matches(self):
+        """A str subclass holding the target status is accepted."""
+        record = {'Submission_Status_1': _Status(self.target)}
+        self.assertTrue(self.auth._has_target_submission_status(record, self.target))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,37 @@
+"""
+Unit tests for the lazily created default configuration in the config module.
+"""
+
+import pytest
+from unittest.mock import patch
+
+import src.config as config_module
+
+
+@pytest.fixture
+def no_default_config():
+    """Fixture that starts each test before the default configuration is created."""
+    with patch.object(config_module, '_default_config', None):
+        yield
+
+
+def test_default_config_created_on_first_access(no_default_config):
+    """Test that default_config is only built when first accessed."""
+    with patch.object(config_module, 'Config') as mock_config:
+        assert config_module._default_config is None
+        default_config = config_module.default_config
+        mock_config.assert_called_once_with()
+        assert default_config is mock_config.return_value
+
+
+def test_default_config_is_get_config_instance(no_default_config):
+    """Test that default_config and get_config() share one instance."""
+    from src.config import default_config
+    assert default_config is config_module.get_config()
+    assert config_module.default_config is default_config
+
+
+def test_unknown_module_attribute():
+    """Test that other missing attributes still raise AttributeError."""
+    with pytest.raises(AttributeError):
+        config_module.missing_attribute
@@ -5,6 +5,7 @@ Unit tests for the lambda_handler module.
 import pytest
 import json
 import os
+import pandas as pd
 from datetime import datetime
 from unittest.mock import patch, MagicMock, mock_open
 from lambda_handler import (
@@ -169,11 +170,7 @@ class TestLambdaHandler:
         mock_archer.get_sir_data.return_value = [{'test': 'data'}]
         mock_get_archer.return_value = mock_archer
         
-        mock_df = MagicMock()
-        mock_df.empty = False
-        mock_df.to_dict.return_value = [{'test': 'processed_data'}]
-        mock_df.__len__.return_value = 1  # Mock the len() function
-        mock_preprocess.return_value = mock_df
+        mock_preprocess.return_value = pd.DataFrame([{'test': 'processed_data'}])
         
         # Test event
         event = {'dry_run': True}
@@ -217,11 +214,7 @@ class TestLambdaHandler:
         mock_archer.get_sir_data.return_value = [{'test': 'data'}]
         mock_get_archer.return_value = mock_archer
         
-        mock_df = MagicMock()
-        mock_df.empty = False
-        mock_df.to_dict.return_value = [{'test': 'processed_data'}]
-        mock_df.__len__.return_value = 1  # Mock the len() function
-        mock_preprocess.return_value = mock_df
+        mock_preprocess.return_value = pd.DataFrame([{'test': 'processed_data'}])
         
         # Mock successful sending
         mock_send.return_value = {'record1': (200, 'success')}
@@ -306,10 +299,7 @@ class TestLambdaHandler:
         mock_archer.get_sir_data.return_value = [{'test': 'data1'}, {'test': 'data2'}]
         mock_get_archer.return_value = mock_archer
         
-        mock_df = MagicMock()
-        mock_df.empty = False
-        mock_df.to_dict.return_value = [{'test': 'data1'}, {'test': 'data2'}]
-        mock_preprocess.return_value = mock_df
+        mock_preprocess.return_value = pd.DataFrame([{'test': 'data1'}, {'test': 'data2'}])
         
         # Mock mixed success/failure
         mock_send.return_value = {
@@ -0,0 +1,77 @@
+"""
+Unit tests for the SSM client and the incident ID helpers in the lambda_handler module.
+"""
+
+import pytest
+from unittest.mock import MagicMock, patch
+
+import lambda_handler as handler_module
+from lambda_handler import get_last_incident_id_from_ssm, update_last_incident_id_in_ssm
+from src.utils.ssm_client import get_ssm_client
+
+
+class ParameterNotFound(Exception):
+    """Stand-in for the botocore ParameterNotFound exception."""
+
+
+@pytest.fixture
+def mock_ssm():
+    """Fixture for a mocked SSM client with an empty read cache."""
+    ssm = MagicMock()
+    ssm.exceptions.ParameterNotFound = ParameterNotFound
+    ssm.get_parameter.return_value = {'Parameter': {'Value': '42'}}
+    handler_module._ssm_cache.clear()
+    with patch.object(handler_module, 'get_ssm_client', return_value=ssm):
+        yield ssm
+    handler_module._ssm_cache.clear()
+
+
+def test_get_last_incident_id_is_cached(mock_ssm):
+    """Test that repeated reads within the TTL only call SSM once."""
+    assert get_last_incident_id_from_ssm() == 42
+    assert get_last_incident_id_from_ssm() == 42
+    assert mock_ssm.get_parameter.call_count == 1
+
+
+def test_get_last_incident_id_cache_expires(mock_ssm):
+    """Test that an expired cache entry is fetched again."""
+    assert get_last_incident_id_from_ssm() == 42
+    handler_module._ssm_cache['expires_at'] = 0
+    mock_ssm.get_parameter.return_value = {'Parameter': {'Value': '43'}}
+    assert get_last_incident_id_from_ssm() == 43
+    assert mock_ssm.get_parameter.call_count == 2
+
+
+def test_get_last_incident_id_parameter_not_found(mock_ssm):
+    """Test that a missing parameter returns 0."""
+    mock_ssm.get_parameter.side_effect = ParameterNotFound()
+    assert get_last_incident_id_from_ssm() == 0
+
+
+def test_get_last_incident_id_error_is_not_cached(mock_ssm):
+    """Test that an SSM error returns 0 without caching it."""
+    mock_ssm.get_parameter.side_effect = RuntimeError("throttled")
+    assert get_last_incident_id_from_ssm() == 0
+    assert handler_module._ssm_cache == {}
+
+
+def test_update_last_incident_id_writes_through(mock_ssm):
+    """Test that an update refreshes the cached value."""
+    update_last_incident_id_in_ssm(100)
+    mock_ssm.put_parameter.assert_called_once()
+    assert get_last_incident_id_from_ssm() == 100
+    mock_ssm.get_parameter.assert_not_called()
+
+
+
+def test_get_ssm_client_is_shared_per_endpoint():
+    """Test that the SSM client is created with botocore once per endpoint URL."""
+    get_ssm_client.cache_clear()
+    with patch('botocore.session.get_session') as mock_get_session:
+        create_client = mock_get_session.return_value.create_client
+        create_client.side_effect = lambda *args, **kwargs: MagicMock()
+        assert get_ssm_client() is get_ssm_client()
+        assert get_ssm_client('http://localhost:4566') is not get_ssm_client()
+    get_ssm_client.cache_clear()
+    create_client.assert_any_call('ssm', endpoint_url='http://localhost:4566')
+    assert create_client.call_count == 2
@@ -2,12 +2,25 @@
 Unit tests for the OPS Portal API module using pytest.
 """
 
+import json
+import os
+import ssl
 import pytest
 from unittest.mock import MagicMock
 import requests
+from cryptography.hazmat.primitives.serialization import pkcs12
+import src.ops_portal.api as api_module
 from src.ops_portal.api import OpsPortalClient, send
 
 
+@pytest.fixture(autouse=True)
+def mock_head(monkeypatch):
+    """Fixture that keeps connection warm-up HEAD requests off the network."""
+    head = MagicMock(return_value=MagicMock(status_code=200))
+    monkeypatch.setattr('requests.Session.head', head)
+    return head
+
+
 @pytest.fixture
 def valid_config():
     """Fixture for valid configuration."""
@@ -60,10 +73,31 @@ def test_init_with_valid_config(valid_config):
     
     # Check session headers
     assert client.session.headers['Accept'] == 'application/json'
+    assert client.session.headers['Accept-Encoding'] == 'gzip, deflate'
     assert client.session.headers['Content-Type'] == 'application/json'
     assert client.session.verify == False
 
 
+def test_init_mounts_pooled_retrying_adapter(valid_config):
+    """Test that the HTTPS adapter is sized for max_workers and retries transient errors."""
+    client = OpsPortalClient(dict(valid_config, max_workers=16))
+    adapter = client.session.get_adapter(valid_config['item_url'])
+    
+    assert adapter._pool_maxsize == 16
+    assert adapter.max_retries.total == 3
+    assert 503 in adapter.max_retries.status_forcelist
+    assert 'POST' in adapter.max_retries.allowed_methods
+    # Only failures that mean the item wasn't created are retried for POSTs
+    assert adapter.max_retries.read == 0
+    assert adapter.max_retries.other == 0
+    assert 502 not in adapter.max_retries.status_forcelist
+    assert 504 not in adapter.max_retries.status_forcelist
+    
+    http_adapter = client.session.get_adapter('http://localhost:8080/api/Item')
+    assert http_adapter._pool_maxsize == 16
+    assert http_adapter.max_retries.total == 3
+
+
 def test_init_with_missing_auth_url(valid_config):
     """Test initialization with missing auth_url."""
     invalid_config = valid_config.copy()
@@ -105,12 +139,13 @@ def test_authenticate_success(valid_config, monkeypatch):
     # Mock the response
     mock_response = MagicMock()
     mock_response.status_code = 200
+    mock_response.headers = {}
     mock_response.json.return_value = "test_token"
     
     # Mock the post method
     def mock_post(self, url, **kwargs):
         assert url == valid_config['auth_url']
-        assert kwargs['json'] == {
+        assert json.loads(kwargs['data']) == {
             'clientId': valid_config['client_id'],
             'clientSecret': valid_config['client_secret']
         }
@@ -127,6 +162,32 @@ def test_authenticate_success(valid_config, monkeypatch):
     assert client.session.headers['Authorization'] == 'Bearer test_token'
 
 
+def test_authenticate_stores_unexpected_token_shape_as_string(valid_config, monkeypatch):
+    """Test that a token response of an unexpected shape is stored as the header string."""
+    mock_response = MagicMock(status_code=200, headers={})
+    mock_response.json.return_value = {"jwt": "abc"}
+    monkeypatch.setattr('requests.Session.post', lambda self, url, **kwargs: mock_response)
+    
+    client = OpsPortalClient(valid_config)
+    assert client.authenticate() is True
+    
+    assert client.token == "{'jwt': 'abc'}"
+    assert client.session.headers['Authorization'] == "Bearer {'jwt': 'abc'}"
+
+
+def test_authenticate_uses_token_header(valid_config, monkeypatch):
+    """Test that a token returned in a response header is used without decoding the body."""
+    mock_response = MagicMock(status_code=204, headers={'Authorization': 'Bearer header_token'})
+    monkeypatch.setattr('requests.Session.post', lambda self, url, **kwargs: mock_response)
+    
+    client = OpsPortalClient(valid_config)
+    assert client.authenticate() is True
+    
+    assert client.token == "header_token"
+    assert client.session.headers['Authorization'] == "Bearer header_token"
+    mock_response.json.assert_not_called()
+
+
 def test_authenticate_failure(valid_config, monkeypatch):
     """Test authentication failure."""
     # Mock the post method to raise an exception
@@ -143,6 +204,23 @@ def test_authenticate_failure(valid_config, monkeypatch):
     assert client.token is None
 
 
+def test_authenticate_error_status(valid_config, monkeypatch, caplog):
+    """Test that an error status fails authentication and is logged without raising."""
+    mock_response = MagicMock(status_code=503, headers={'Content-Type': 'text/html'}, encoding=None)
+    mock_response.content = b"ASP.NET Core app failed to start"
+    monkeypatch.setattr('requests.Session.post', lambda self, url, **kwargs: mock_response)
+    
+    client = OpsPortalClient(valid_config)
+    with caplog.at_level('ERROR'):
+        result = client.authenticate()
+    
+    assert result is False
+    assert client.token is None
+    mock_response.raise_for_status.assert_not_called()
+    assert "OPS Portal service appears to be down (HTTP 503)" in caplog.text
+    assert "Service startup failure detected" in caplog.text
+
+
 def test_send_record_success(valid_config, test_record, monkeypatch):
     """Test successful sending of a record."""
     # Mock the response
@@ -153,7 +231,7 @@ def test_send_record_success(valid_config, test_record, monkeypatch):
     # Mock the post method
     def mock_post(self, url, **kwargs):
         assert url == valid_config['item_url']
-        assert kwargs['json'] == test_record
+        assert json.loads(kwargs['data']) == test_record
         return mock_response
     
     monkeypatch.setattr('requests.Session.post', mock_post)
@@ -163,9 +241,10 @@ def test_send_record_success(valid_config, test_record, monkeypatch):
     
     status_code, response_data = client.send_record(test_record)
     
-    # Verify the result
+    # Verify the result; the body of a successful response is not decoded
     assert status_code == 200
-    assert response_data == {"status": "success"}
+    assert response_data is None
+    mock_response.json.assert_not_called()
 
 
 def test_send_record_failure(valid_config, test_record, monkeypatch):
@@ -173,6 +252,8 @@ def test_send_record_failure(valid_config, test_record, monkeypatch):
     # Mock the response
     mock_response = MagicMock()
     mock_response.status_code = 400
+    mock_response.headers = {'Content-Type': 'application/json'}
+    mock_response.content = b'{"error": "Bad request"}'
     mock_response.json.return_value = {"error": "Bad request"}
     
     # Mock the post method
@@ -209,6 +290,32 @@ def test_send_record_exception(valid_config, test_record, monkeypatch):
     assert response_data == "Connection error"
 
 
+def test_send_record_reauthenticates_on_401(valid_config, test_record, monkeypatch):
+    """Test that an expired token is refreshed once and the record is resent."""
+    expired = MagicMock(status_code=401)
+    created = MagicMock(status_code=201)
+    responses = [expired, created]
+    
+    def mock_post(self, url, **kwargs):
+        return responses.pop(0)
+    
+    def mock_authenticate(self):
+        self.token = "new_token"
+        return True
+    
+    monkeypatch.setattr('requests.Session.post', mock_post)
+    monkeypatch.setattr(OpsPortalClient, 'authenticate', mock_authenticate)
+    
+    client = OpsPortalClient(valid_config)
+    client.token = "expired_token"
+    
+    status_code, response_data = client.send_record(test_record)
+    
+    assert status_code == 201
+    assert response_data is None
+    assert client.token == "new_token"
+
+
 def test_send_records_success(valid_config, test_records, monkeypatch):
     """Test successful sending of multiple records."""
     # Mock the authenticate method
@@ -220,7 +327,7 @@ def test_send_records_success(valid_config, test_records, monkeypatch):
     
     # Mock the send_record method
     send_record_calls = []
-    def mock_send_record(self, record):
+    def mock_send_record(self, record, record_id=None):
         send_record_calls.append(record)
         return (200, {"status": "success"})
     
@@ -234,10 +341,88 @@ def test_send_records_success(valid_config, test_records, monkeypatch):
     assert responses['test_id_1'] == (200, {"status": "success"})
     assert responses['test_id_2'] == (200, {"status": "success"})
     
-    # Verify the send_record method was called for each record
+    # Verify the send_record method was called for each record (records are sent
+    # concurrently, so the call order is not guaranteed)
     assert len(send_record_calls) == 2
-    assert send_record_calls[0] == test_records[0]
-    assert send_record_calls[1] == test_records[1]
+    assert test_records[0] in send_record_calls
+    assert test_records[1] in send_record_calls
+
+
+def test_send_records_concurrently(valid_config, monkeypatch):
+    """Test that records are sent concurrently, bounded by max_workers."""
+    import threading
+    import time
+    
+    lock = threading.Lock()
+    in_flight = 0
+    max_in_flight = 0
+    def mock_send_record(self, record, record_id=None):
+        nonlocal in_flight, max_in_flight
+        with lock:
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+        time.sleep(0.01)
+        with lock:
+            in_flight -= 1
+        return (200, record['tenantItemID'])
+    
+    monkeypatch.setattr(OpsPortalClient, 'send_record', mock_send_record)
+    
+    records = [{'tenantItemID': f'test_id_{i}'} for i in range(12)]
+    client = OpsPortalClient(dict(valid_config, max_workers=4))
+    client.token = "test_token"
+    responses = client.send_records(records)
+    
+    # Every record gets its own response, in record order
+    assert list(responses) == [r['tenantItemID'] for r in records]
+    assert all(responses[key] == (200, key) for key in responses)
+    assert 1 < max_in_flight <= 4
+
+
+def test_send_records_from_generator(valid_config, test_records, monkeypatch):
+    """Test sending records produced lazily by a generator."""
+    def mock_send_record(self, record, record_id=None):
+        return (200, {"status": "success"})
+
+    monkeypatch.setattr(OpsPortalClient, 'send_record', mock_send_record)
+
+    client = OpsPortalClient(valid_config)
+    client.token = "test_token"
+    responses = client.send_records(record for record in test_records)
+
+    assert list(responses) == ['test_id_1', 'test_id_2']
+    assert responses['test_id_2'] == (200, {"status": "success"})
+
+
+def test_send_records_authenticates_while_producing_records(valid_config, test_records, monkeypatch):
+    """Test that records are produced while authentication is in flight."""
+    import threading
+
+    records_produced = threading.Event()
+    def mock_authenticate(self):
+        # Only succeeds if every record was produced before the token came back
+        if not records_produced.wait(timeout=5):
+            return False
+        self.token = "test_token"
+        return True
+
+    def mock_send_record(self, record, record_id=None):
+        return (200, {"status": "success"})
+
+    monkeypatch.setattr(OpsPortalClient, 'authenticate', mock_authenticate)
+    monkeypatch.setattr(OpsPortalClient, 'send_record', mock_send_record)
+
+    def produce_records():
+        yield from test_records
+        records_produced.set()
+
+    client = OpsPortalClient(valid_config)
+    responses = client.send_records(produce_records())
+
+    assert responses == {
+        'test_id_1': (200, {"status": "success"}),
+        'test_id_2': (200, {"status": "success"}),
+    }
 
 
 def test_send_records_with_token(valid_config, test_records, monkeypatch):
@@ -253,7 +438,7 @@ def test_send_records_with_token(valid_config, test_records, monkeypatch):
     
     # Mock the send_record method
     send_record_calls = []
-    def mock_send_record(self, record):
+    def mock_send_record(self, record, record_id=None):
         send_record_calls.append(record)
         return (200, {"status": "success"})
     
@@ -270,6 +455,38 @@ def test_send_records_with_token(valid_config, test_records, monkeypatch):
     assert len(send_record_calls) == 2
 
 
+def test_send_records_warms_item_connection_during_authentication(valid_config, test_records, monkeypatch, mock_head):
+    """Test that the item host connection is opened while authenticating when the hosts differ."""
+    def mock_authenticate(self):
+        self.token = "test_token"
+        return True
+    
+    monkeypatch.setattr(OpsPortalClient, 'authenticate', mock_authenticate)
+    monkeypatch.setattr(OpsPortalClient, 'send_record', lambda self, record, record_id=None: (201, None))
+    
+    client = OpsPortalClient(valid_config)
+    client.send_records(test_records)
+    
+    mock_head.assert_called_once_with(valid_config['item_url'], timeout=10)
+    
+    # Same host: the token request already opens the connection
+    mock_head.reset_mock()
+    same_host = OpsPortalClient(dict(valid_config, item_url='https://test-auth-url.com/api/Item'))
+    same_host.send_records(test_records)
+    mock_head.assert_not_called()
+
+
+def test_send_records_keeps_records_without_ids_apart(valid_config, monkeypatch):
+    """Test that records without a tenantItemID are each reported under their own key."""
+    monkeypatch.setattr(OpsPortalClient, 'send_record', lambda self, record, record_id=None: (201, record_id))
+    
+    client = OpsPortalClient(valid_config)
+    client.token = "test_token"
+    responses = client.send_records([{'title': 'a'}, {'tenantItemID': 'x'}, {'title': 'b'}])
+    
+    assert responses == {'unknown_0': (201, 'unknown_0'), 'x': (201, 'x'), 'unknown_2': (201, 'unknown_2')}
+
+
 def test_send_records_authentication_failure(valid_config, test_records, monkeypatch):
     """Test sending records when authentication fails."""
     # Mock the authenticate method to fail
@@ -287,6 +504,92 @@ def test_send_records_authentication_failure(valid_config, test_records, monkeyp
     assert responses['test_id_2'] == (0, "Authentication failed")
 
 
+def test_send_records_batch_posts_one_array(valid_config, test_records, monkeypatch):
+    """Test that a batch of records is sent as a single JSON array."""
+    posts = []
+    def mock_post(self, url, **kwargs):
+        posts.append(json.loads(kwargs['data']))
+        return MagicMock(status_code=201)
+    
+    monkeypatch.setattr('requests.Session.post', mock_post)
+    
+    client = OpsPortalClient(valid_config)
+    client.token = "test_token"
+    responses = client.send_records_batch(iter(test_records), chunk_size=10)
+    
+    assert posts == [test_records]
+    assert responses == {'test_id_1': (201, None), 'test_id_2': (201, None)}
+
+
+def test_send_records_batch_reports_each_item(valid_config, test_records, monkeypatch):
+    """Test that each record gets its own result from the batch response array."""
+    items = [{'status': 201}, {'status': 422, 'error': 'invalid subtype'}, {'status': 201}]
+    def mock_post(self, url, **kwargs):
+        return MagicMock(status_code=207, headers={'Content-Type': 'application/json'},
+                         content=json.dumps(items).encode(), encoding='utf-8')
+    
+    monkeypatch.setattr('requests.Session.post', mock_post)
+    
+    client = OpsPortalClient(valid_config)
+    client.token = "test_token"
+    records = test_records + [{'title': 'no id'}]
+    responses = client.send_records_batch(records, chunk_size=10)
+    
+    assert responses == {
+        'test_id_1': (201, None),
+        'test_id_2': (422, {'status': 422, 'error': 'invalid subtype'}),
+        'unknown_2': (201, None),
+    }
+
+
+def test_send_records_batch_numbers_unknown_ids_across_chunks(valid_config, monkeypatch):
+    """Test that records without an ID in different chunks don't share a key."""
+    monkeypatch.setattr('requests.Session.post', lambda self, url, **kwargs: MagicMock(status_code=201))
+    
+    client = OpsPortalClient(valid_config)
+    client.token = "test_token"
+    responses = client.send_records_batch([{'title': 'a'}, {'title': 'b'}], chunk_size=1)
+    
+    assert responses == {'unknown_0': (201, None), 'unknown_1': (201, None)}
+
+
+def test_send_batches_to_batch_url(valid_config, test_records, monkeypatch):
+    """Test that send() posts arrays to batch_url when it is configured."""
+    urls = []
+    def mock_post(self, url, **kwargs):
+        urls.append(url)
+        return MagicMock(status_code=200)
+    
+    monkeypatch.setattr('requests.Session.post', mock_post)
+    monkeypatch.setattr(api_module, '_clients', {})
+    monkeypatch.setattr(OpsPortalClient, 'has_valid_token', lambda self: True)
+    
+    responses = send(test_records, dict(valid_config, batch_url='https://test-item-url.com/bulk'))
+    
+    assert urls == ['https://test-item-url.com/bulk']
+    assert responses == {'test_id_1': (200, None), 'test_id_2': (200, None)}
+
+
+def test_send_records_batch_falls_back_to_single_records(valid_config, test_records, monkeypatch):
+    """Test that records are sent individually once the endpoint rejects an array."""
+    posts = []
+    def mock_post(self, url, **kwargs):
+        body = json.loads(kwargs['data'])
+        posts.append(body)
+        return MagicMock(status_code=415 if isinstance(body, list) else 201)
+    
+    monkeypatch.setattr('requests.Session.post', mock_post)
+    
+    client = OpsPortalClient(valid_config)
+    client.token = "test_token"
+    responses = client.send_records_batch(test_records, chunk_size=1)
+    
+    # Only the first chunk is tried as an array
+    assert posts[0] == [test_records[0]]
+    assert sorted(posts[1:], key=lambda r: r['tenantItemID']) == test_records
+    assert responses == {'test_id_1': (201, None), 'test_id_2': (201, None)}
+
+
 def test_send_function(valid_config, test_records, monkeypatch):
     """Test the standalone send function."""
     # Mock the send_records method
@@ -331,3 +634,195 @@ def test_send_function_with_default_config(test_records, monkeypatch):
     
     # Verify the send_records method was called with the correct records
     assert send_records_called_with == test_records
+
+
+def test_send_function_reuses_client(valid_config, test_records, monkeypatch):
+    """Test that send() reuses one client per configuration."""
+    clients = []
+    def mock_send_records(self, records):
+        clients.append(self)
+        return {}
+    
+    monkeypatch.setattr(OpsPortalClient, 'send_records', mock_send_records)
+    monkeypatch.setattr(api_module, '_clients', {})
+    
+    send(test_records, valid_config)
+    send(test_records, dict(valid_config))
+    send(test_records, dict(valid_config, client_id='other_client_id'))
+    
+    assert clients[0] is clients[1]
+    assert clients[2] is not clients[0]
+
+
+def _self_signed_certificate():
+    """Create a throwaway private key and self-signed certificate."""
+    import datetime
+    from cryptography import x509
+    from cryptography.hazmat.primitives import hashes
+    from cryptography.hazmat.primitives.asymmetric import ec
+    from cryptography.x509.oid import NameOID
+    
+    key = ec.generate_private_key(ec.SECP256R1())
+    name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, 'test-client')])
+    now = datetime.datetime.now(datetime.timezone.utc)
+    certificate = (
+        x509.CertificateBuilder()
+        .subject_name(name)
+        .issuer_name(name)
+        .public_key(key.public_key())
+        .serial_number(x509.random_serial_number())
+        .not_valid_before(now)
+        .not_valid_after(now + datetime.timedelta(days=1))
+        .sign(key, hashes.SHA256())
+    )
+    return key, certificate
+
+
+def test_pfx_certificate_is_extracted_once(valid_config, monkeypatch):
+    """Test that PKCS#12 data is parsed once per certificate and password."""
+    private_key, certificate = _self_signed_certificate()
+    load = MagicMock(return_value=(private_key, certificate, []))
+    
+    monkeypatch.setattr(pkcs12, 'load_key_and_certificates', load)
+    monkeypatch.setattr(api_module, '_pem_cache', {})
+    
+    config = dict(valid_config, cert_pfx_data=b'MOCK_PFX_DATA', pfx_password='secret')
+    first = OpsPortalClient(config)
+    second = OpsPortalClient(config)
+    
+    assert load.call_count == 1
+    assert first.client_cert_pem == second.client_cert_pem
+    assert first.client_cert_pem.startswith(b'-----BEGIN CERTIFICATE-----')
+
+
+def test_client_certificate_loaded_into_shared_ssl_context(valid_config, monkeypatch, tmp_path):
+    """Test that the client certificate is loaded into the adapter's SSL context without leaving files behind."""
+    import tempfile
+    
+    private_key, certificate = _self_signed_certificate()
+    monkeypatch.setattr(pkcs12, 'load_key_and_certificates',
+                        MagicMock(return_value=(private_key, certificate, [])))
+    monkeypatch.setattr(api_module, '_pem_cache', {})
+    monkeypatch.setattr(tempfile, 'tempdir', str(tmp_path))
+    
+    client = OpsPortalClient(dict(valid_config, cert_pfx_data=b'MOCK_PFX_DATA'))
+    
+    adapter = client.session.get_adapter(valid_config['item_url'])
+    assert adapter.ssl_context is client._ssl_context
+    assert client.client_cert_pem is not None
+    # The session doesn't carry certificate files, so urllib3 doesn't reload them per
+    # connection, and the decrypted key isn't left on disk
+    assert client.session.cert is None
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_client_certificate_files_removed_with_client(valid_config, monkeypatch, tmp_path):
+    """Test that certificate files set on the session are removed once the client is discarded."""
+    import gc
+    import tempfile
+    
+    private_key, certificate = _self_signed_certificate()
+    monkeypatch.setattr(pkcs12, 'load_key_and_certificates',
+                        MagicMock(return_value=(private_key, certificate, [])))
+    monkeypatch.setattr(api_module, '_pem_cache', {})
+    monkeypatch.setattr(tempfile, 'tempdir', str(tmp_path))
+    # Without the shared SSL context the certificate files stay on the session
+    monkeypatch.setattr(OpsPortalClient, '_create_ssl_context', MagicMock(side_effect=ssl.SSLError))
+    
+    client = OpsPortalClient(dict(valid_config, cert_pfx_data=b'MOCK_PFX_DATA'))
+    assert all(os.path.exists(path) for path in client.session.cert)
+    
+    del client
+    gc.collect()
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_ssl_context_loads_ca_bundle_once(valid_config):
+    """Test that the CA bundle is loaded into the shared context rather than per connection."""
+    client = OpsPortalClient(dict(valid_config, verify_ssl=True))
+    adapter = client.session.get_adapter(valid_config['item_url'])
+    
+    assert adapter.ssl_context is client._ssl_context
+    assert client._ssl_context.cert_store_stats()['x509_ca'] > 0
+    
+    conn = adapter.poolmanager.connection_from_url(valid_config['item_url'])
+    adapter.cert_verify(conn, valid_config['item_url'], True, None)
+    assert conn.ca_certs is None
+    assert conn.cert_reqs == 'CERT_REQUIRED'
+
+
+def test_send_record_logs_client_error_status(valid_config, test_record, monkeypatch, caplog):
+    """Test that known client error statuses are logged with their specific message."""
+    mock_response = MagicMock(status_code=404, headers={'Content-Type': 'application/json'})
+    mock_response.content = b'{"error": "Not found"}'
+    mock_response.json.return_value = {"error": "Not found"}
+    monkeypatch.setattr('requests.Session.post', lambda self, url, **kwargs: mock_response)
+    
+    client = OpsPortalClient(valid_config)
+    client.token = "test_token"
+    
+    with caplog.at_level('ERROR'):
+        status_code, _ = client.send_record(test_record)
+    
+    assert status_code == 404
+    assert "Item endpoint not found when sending record test_id_123" in caplog.text
+
+
+def test_send_record_non_json_error_returns_text(valid_config, test_record, monkeypatch):
+    """Test that a non-JSON error body is returned as text without trying to decode it."""
+    mock_response = MagicMock(status_code=502, headers={'Content-Type': 'text/html; charset=utf-8'}, encoding='utf-8')
+    mock_response.content = b"<html>Bad Gateway</html>"
+    monkeypatch.setattr('requests.Session.post', lambda self, url, **kwargs: mock_response)
+    
+    client = OpsPortalClient(valid_config)
+    client.token = "test_token"
+    
+    status_code, response_data = client.send_record(test_record)
+    
+    assert status_code == 502
+    assert response_data == "<html>Bad Gateway</html>"
+    mock_response.json.assert_not_called()
+
+
+def _jwt(claims):
+    """Build an unsigned JWT carrying the given claims."""
+    import base64
+    encode = lambda data: base64.urlsafe_b64encode(json.dumps(data).encode()).rstrip(b'=').decode()
+    return f"{encode({'alg': 'none'})}.{encode(claims)}.signature"
+
+
+def test_authenticate_reads_jwt_expiry(valid_config, monkeypatch):
+    """Test that the exp claim of a JWT token is recorded."""
+    mock_response = MagicMock(status_code=200, headers={})
+    mock_response.json.return_value = _jwt({'exp': 2000000000})
+    monkeypatch.setattr('requests.Session.post', lambda self, url, **kwargs: mock_response)
+    
+    client = OpsPortalClient(valid_config)
+    assert client.authenticate() is True
+    assert client.token_expiry == 2000000000
+    assert client.has_valid_token() is True
+
+
+def test_send_records_renews_expiring_token(valid_config, test_records, monkeypatch):
+    """Test that a token close to its expiry is renewed before sending."""
+    import time
+    
+    authenticate_calls = []
+    def mock_authenticate(self):
+        authenticate_calls.append(self.token)
+        self.token = _jwt({'exp': time.time() + 3600})
+        self.token_expiry = time.time() + 3600
+        return True
+    
+    monkeypatch.setattr(OpsPortalClient, 'authenticate', mock_authenticate)
+    monkeypatch.setattr(OpsPortalClient, 'send_record', lambda self, record, record_id=None: (200, None))
+    
+    client = OpsPortalClient(valid_config)
+    client.token = "old_token"
+    client.token_expiry = time.time() + 5
+    
+    client.send_records(test_records)
+    client.send_records(test_records)
+    
+    # Renewed once; the new token is reused for the second batch
+    assert authenticate_calls == ["old_token"]
@@ -1,5 +1,6 @@
 import pytest
 import pandas as pd
+import numpy as np
 import tempfile
 import os
 import csv
@@ -18,10 +19,10 @@ def rename_columns_for_test(data):
             record['Incident_ID'] = record.pop('Incidents_Id')
     return data
 
-from src.processing.html_stripper import strip_tags
+from src.processing.html_stripper import strip_tags, strip_tags_series
 from src.processing.field_mapping import get_field_mapping, map_field_name
 from src.processing.default_fields import get_default_fields, get_default_value
-from src.processing.preprocess import preprocess
+from src.processing.preprocess import preprocess, _explode_product, _clean_merge_column, _load_category_map
 
 class TestProcessing:
 
@@ -37,6 +38,26 @@ class TestProcessing:
         html = '<div><p>Hello <b>World</b>!</p><br/><span>Test</span></div>'
         assert strip_tags(html) == 'Hello World!Test'
 
+    def test_html_stripper_reuses_parser_cleanly(self):
+        # An incomplete trailing tag must not carry over into the next call
+        assert strip_tags('text <b') == 'text '
+        assert strip_tags('<i>next</i>') == 'next'
+        assert strip_tags('no markup') == 'no markup'
+        
+    def test_html_stripper_series(self):
+        values = pd.Series(['<p>Hello <b>World</b>!</p>', 'plain text', 'a &amp; b', None, ''],
+                           index=[10, 11, 12, 13, 14])
+        result = strip_tags_series(values)
+        assert result.tolist() == ['Hello World!', 'plain text', 'a & b', '', '']
+        assert result.index.tolist() == [10, 11, 12, 13, 14]
+        
+    def test_html_stripper_series_parses_repeated_values_once(self):
+        values = pd.Series(['<p>same</p>'] * 3 + ['<i>other</i>'])
+        with patch('src.processing.html_stripper.strip_tags', wraps=strip_tags) as parse:
+            result = strip_tags_series(values)
+        assert result.tolist() == ['same', 'same', 'same', 'other']
+        assert parse.call_count == 2
+        
     def test_get_field_mapping(self):
         mapping = get_field_mapping()
         assert len(mapping) != 0
@@ -61,6 +82,36 @@ class TestProcessing:
         assert get_default_value('dissemination') == 'FOUO'
         assert get_default_value('invalid') == None
         
+    def test_explode_product_matches_sequential_explode(self):
+        df = pd.DataFrame({
+            'Type_of_SIR': [['A', 'B'], 'C', [], None],
+            'Category_Type': [['X'], ['Y', 'Z'], ['W'], []],
+            'Sub_Category_Type': [['1', '2'], [], '3', ['4']],
+            'SIR_': ['SIR-1', 'SIR-2', 'SIR-3', 'SIR-4'],
+        }, index=pd.Index([1, 2, 3, 4], name='Incident_ID'))
+        columns = ['Type_of_SIR', 'Category_Type', 'Sub_Category_Type']
+        expected = df
+        for col in columns:
+            expected = expected.explode(col)
+        pd.testing.assert_frame_equal(_explode_product(df, columns), expected)
+        
+    def test_clean_merge_column_matches_string_replace(self):
+        values = pd.Series(['A', np.nan, None, 'None', 'nan', 1.5, ''], dtype=object)
+        expected = values.astype(str).replace('nan', '').replace('None', '')
+        pd.testing.assert_series_equal(_clean_merge_column(values), expected)
+        
+    def test_load_category_map_reloads_changed_file(self, tmpdir):
+        category_file = tmpdir.join('category_mappings.csv')
+        category_file.write("Type_of_SIR,Category_Type,Sub_Category_Type,type\nA,B,C,Security\n")
+        first = _load_category_map(category_file.strpath)
+        assert _load_category_map(category_file.strpath) is first
+        
+        category_file.write("Type_of_SIR,Category_Type,Sub_Category_Type,type\nA,B,C,Physical\n")
+        os.utime(category_file.strpath, ns=(0, 0))
+        reloaded = _load_category_map(category_file.strpath)
+        assert reloaded is not first
+        assert reloaded.loc[('A', 'B', 'C'), 'type'] == 'Physical'
+        
     def test_preprocess_empty_data(self):
         """Test preprocess with empty data."""
         last_run = datetime(2023, 1, 1)
@@ -181,6 +232,9 @@ class TestProcessing:
         assert record['phase'] == 'Monitored'
         assert record['dissemination'] == 'FOUO'
         
+        # Check that the highest incident ID was recorded
+        assert result.attrs['max_incident_id'] == result['Incident_ID'].max()
+        
     def test_preprocess_filtering(self, tmpdir):
         """Test data filtering functionality using mock data."""
         # Create a temporary category mapping file
@@ -7,7 +7,7 @@ import os
 # Add the project root directory to the Python path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from src.utils.time_utils import format_datetime_for_api
+from src.utils.time_utils import format_datetime_for_api, get_last_run_time, update_last_run_time
 
 class TestTimeUtils:
     
@@ -94,3 +94,27 @@ class TestTimeUtils:
         assert result[0] == "2025-06-25T14:58:17.424Z"
         assert pd.isna(result[1])
         assert result[2] == "2025-06-27T08:15:45.123Z"
+    
+    def test_format_datetime_for_api_keeps_wall_time_of_offset_series(self):
+        """Test that a timezone-aware datetime64 Series keeps its wall-clock time."""
+        series = pd.to_datetime(pd.Series([
+            '2025-06-25T10:58:17.424987-04:00',
+            None,
+            '2025-06-26T00:00:00.000000-04:00'
+        ]))
+        
+        result = format_datetime_for_api(series)
+        
+        assert result.tolist() == ["2025-06-25T10:58:17.424Z", None, "2025-06-26T00:00:00.000Z"]
+    
+    def test_update_last_run_time_localizes_naive_timestamp_to_eastern(self, tmpdir):
+        """Test that a naive timestamp is recorded as US/Eastern time."""
+        winter = tmpdir.join('winter.txt')
+        summer = tmpdir.join('summer.txt')
+        
+        update_last_run_time(winter.strpath, datetime(2025, 1, 15, 9, 30))
+        update_last_run_time(summer.strpath, datetime(2025, 7, 15, 9, 30))
+        
+        assert winter.read() == '2025-01-15T09:30:00-0500'
+        assert summer.read() == '2025-07-15T09:30:00-0400'
+        assert get_last_run_time(winter.strpath).utcoffset().total_seconds() == -5 * 3600
@@ -48,6 +48,10 @@ class TestUtils:
         assert log is not None
         assert log.name == 'src.test_module'
         
+    def test_logger_is_cached(self):
+        assert get_logger('test_module') is get_logger('test_module')
+        assert get_logger() is get_logger()
+        
     def test_log_exception(self):
         log = get_logger('test')
         # Test that log_exception doesn't raise an error